@@ -46,7 +46,7 @@ async def handle_send_notification(call: ServiceCall):
     data = {
         "actions": actions,
         "tag": f"{dog_name}_frage",
-        "group": f"paw_control_{dog_name}",
+        "group": f"{DOMAIN}_{dog_name}",
         "clickAction": "/lovelace/pawcontrol",
     }
 
@@ -3,15 +3,29 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from homeassistant.util.dt import now
 
+from .const import ACTIVITY_TYPES
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
+# Labels for health events such as vaccinations
+_HEALTH_EVENT_LABELS = MappingProxyType(
+    {
+        "medication": "Medication given",
+        "vet_visit": "Vet visit",
+        "health_check": "Health check",
+        "vaccination": "Vaccination",
+        "weight_check": "Weight check",
+    }
+)
+
 
 async def async_log_activity(
     hass: HomeAssistant, dog_name: str, activity_type: str, notes: str | None = None
@@ -30,8 +44,10 @@ async def async_log_activity(
             )
             _LOGGER.debug("Incremented counter %s", counter_entity)
 
+        activity = ACTIVITY_TYPES.get(activity_type)
+
         # Update datetime for specific activities
-        if activity_type in ["walk", "feeding", "outside", "poop"]:
+        if activity is not None and activity.tracks_last_time:
             datetime_entity = f"input_datetime.{dog_id}_last_{activity_type}"
             if hass.states.get(datetime_entity):
                 await hass.services.async_call(
@@ -42,18 +58,9 @@ async def async_log_activity(
                 _LOGGER.debug("Updated datetime %s", datetime_entity)
 
         # Update last activity text
-        readable_activities = {
-            "walk": "Walk",
-            "feeding": "Feeding",
-            "outside": "Outside",
-            "poop": "Potty",
-            "play": "Play",
-            "training": "Training",
-            "medication": "Medication",
-            "health_check": "Health check",
-        }
-
-        activity_label = readable_activities.get(activity_type, activity_type.title())
+        activity_label = (
+            activity.name if activity is not None else activity_type.title()
+        )
         time_str = timestamp.strftime("%H:%M")
 
         last_activity_text = f"{time_str} - {activity_label}"
@@ -133,15 +140,7 @@ async def async_log_health_event(
 ) -> None:
     """Log a health-related event."""
 
-    health_events = {
-        "medication": "Medication given",
-        "vet_visit": "Vet visit",
-        "health_check": "Health check",
-        "vaccination": "Vaccination",
-        "weight_check": "Weight check",
-    }
-
-    event_label = health_events.get(event_type, event_type)
+    event_label = _HEALTH_EVENT_LABELS.get(event_type, event_type)
     await async_log_activity(
         hass,
         dog_name,
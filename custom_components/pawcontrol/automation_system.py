@@ -18,9 +18,12 @@ from .const import (
     CONF_DOG_NAME,
     DOMAIN,
     FEEDING_TYPES,
-    MEAL_TYPES,
+    HEALTH_STATUS_BY_LABEL,
+    INVALID_STATES,
+    HealthStatus,
 )
 from .helpers.json import JSONMutableMapping
+from .utils import get_meal_label, parse_time_of_day
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -203,7 +206,7 @@ class PawControlAutomationManager(RestoreEntity):
                     "type": "feeding",
                     "meal_type": meal,
                     "trigger_entities": [time_entity, status_entity],
-                    "description": f"Feeding reminder for {MEAL_TYPES.get(meal, meal)}",
+                    "description": f"Feeding reminder for {get_meal_label(meal)}",
                     "active": True,
                 }
 
@@ -410,20 +413,17 @@ class PawControlAutomationManager(RestoreEntity):
             time_entity = f"input_datetime.{self._dog_name}_feeding_{meal_type}_time"
             time_state = self.hass.states.get(time_entity)
 
-            if not time_state or time_state.state in ["unknown", "unavailable"]:
+            if not time_state or time_state.state in INVALID_STATES:
                 return
 
             scheduled_time = time_state.state
-            meal_name = MEAL_TYPES.get(meal_type, meal_type)
+            meal_name = get_meal_label(meal_type)
 
             # Check if it's time for reminder (30 minutes before scheduled time)
             now = dt_now()
             try:
-                scheduled_time_obj = datetime.strptime(
-                    scheduled_time, "%H:%M:%S"
-                ).time()
                 scheduled_today = datetime.combine(
-                    now.date(), scheduled_time_obj, tzinfo=now.tzinfo
+                    now.date(), parse_time_of_day(scheduled_time), tzinfo=now.tzinfo
                 )
 
                 reminder_time = scheduled_today - timedelta(minutes=30)
@@ -710,21 +710,12 @@ class PawControlAutomationManager(RestoreEntity):
     ) -> None:
         """Handle specific health status changes."""
         try:
-            # Define health status severity levels
-            severity_levels = {
-                "Ausgezeichnet": 5,
-                "Sehr gut": 4,
-                "Gut": 3,
-                "Normal": 2,
-                "Unwohl": 1,
-                "Krank": 0,
-            }
-
-            new_severity = severity_levels.get(new_status, 2)
-            old_severity = severity_levels.get(old_status, 2)
+            # Severity rises with the enum value; unknown labels count as normal
+            new_severity = HEALTH_STATUS_BY_LABEL.get(new_status, HealthStatus.NORMAL)
+            old_severity = HEALTH_STATUS_BY_LABEL.get(old_status, HealthStatus.NORMAL)
 
             # Alert if health deteriorated significantly
-            if new_severity < old_severity - 1:
+            if new_severity > old_severity + 1:
                 if self.hass.services.has_service("persistent_notification", "create"):
                     await self.hass.services.async_call(
                         "persistent_notification",
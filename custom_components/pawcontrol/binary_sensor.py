@@ -8,9 +8,9 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 
-from .const import DOMAIN
+from .const import DOMAIN, Icon
 from .entities import PawControlBinarySensorEntity
-from .helpers.entity import get_icon, parse_datetime
+from .helpers.entity import parse_datetime
 from .helpers.json import JSONMutableMapping, ensure_json_mapping
 
 if TYPE_CHECKING:
@@ -68,7 +68,7 @@ class PawControlNeedsWalkBinarySensor(PawControlBinarySensorEntity):
     def __init__(self, coordinator: PawControlCoordinator, dog_name: str) -> None:
         """Initialize the binary sensor."""
         super().__init__(
-            coordinator, dog_name=dog_name, key="needs_walk", icon=get_icon("walk")
+            coordinator, dog_name=dog_name, key="needs_walk", icon=Icon.WALK
         )
 
     @property
@@ -90,7 +90,7 @@ class PawControlIsOutsideBinarySensor(PawControlBinarySensorEntity):
             coordinator,
             dog_name=dog_name,
             key="is_outside",
-            icon=get_icon("outside"),
+            icon=Icon.OUTSIDE,
             device_class=BinarySensorDeviceClass.PRESENCE,
         )
 
@@ -113,7 +113,7 @@ class PawControlEmergencyModeBinarySensor(PawControlBinarySensorEntity):
             coordinator,
             dog_name=dog_name,
             key="emergency_mode",
-            icon=get_icon("emergency"),
+            icon=Icon.EMERGENCY,
             device_class=BinarySensorDeviceClass.PROBLEM,
         )
 
@@ -136,7 +136,7 @@ class PawControlVisitorModeBinarySensor(PawControlBinarySensorEntity):
     def __init__(self, coordinator: PawControlCoordinator, dog_name: str) -> None:
         """Initialize the binary sensor."""
         super().__init__(
-            coordinator, dog_name=dog_name, key="visitor_mode", icon=get_icon("visitor")
+            coordinator, dog_name=dog_name, key="visitor_mode", icon=Icon.VISITOR
         )
 
     @property
@@ -216,7 +216,7 @@ class PawControlGPSTrackingBinarySensor(PawControlBinarySensorEntity):
     def __init__(self, coordinator: PawControlCoordinator, dog_name: str) -> None:
         """Initialize the binary sensor."""
         super().__init__(
-            coordinator, dog_name=dog_name, key="gps_tracking", icon=get_icon("gps")
+            coordinator, dog_name=dog_name, key="gps_tracking", icon=Icon.GPS
         )
 
     @property
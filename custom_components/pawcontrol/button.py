@@ -6,9 +6,9 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from .const import DOMAIN
+from .const import DOMAIN, Icon
 from .entities import PawControlButtonEntity
-from .helpers.entity import get_icon
+from .utils import safe_batch_service_call
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -59,7 +59,7 @@ class PawControlFeedMorningButton(PawControlButtonEntity):
             coordinator,
             dog_name=dog_name,
             key="feed_morning",
-            icon=get_icon("morning"),
+            icon=Icon.MORNING,
         )
 
     async def async_press(self) -> None:
@@ -100,7 +100,7 @@ class PawControlFeedEveningButton(PawControlButtonEntity):
             coordinator,
             dog_name=dog_name,
             key="feed_evening",
-            icon=get_icon("evening"),
+            icon=Icon.EVENING,
         )
 
     async def async_press(self) -> None:
@@ -144,7 +144,7 @@ class PawControlMarkOutsideButton(PawControlButtonEntity):
             coordinator,
             dog_name=dog_name,
             key="mark_outside",
-            icon=get_icon("outside"),
+            icon=Icon.OUTSIDE,
         )
 
     async def async_press(self) -> None:
@@ -183,7 +183,7 @@ class PawControlMarkPoopDoneButton(PawControlButtonEntity):
             coordinator,
             dog_name=dog_name,
             key="mark_poop_done",
-            icon=get_icon("poop"),
+            icon=Icon.POOP,
         )
 
     async def async_press(self) -> None:
@@ -237,10 +237,9 @@ class PawControlResetDailyDataButton(PawControlButtonEntity):
                 f"input_boolean.{self._dog_name}_poop_done",
             ]
 
-            for entity_id in boolean_entities:
-                await self._safe_service_call(
-                    "input_boolean", "turn_off", {"entity_id": entity_id}
-                )
+            await safe_batch_service_call(
+                self.hass, "input_boolean", "turn_off", boolean_entities
+            )
 
             # Reset counters
             counter_entities = [
@@ -249,10 +248,9 @@ class PawControlResetDailyDataButton(PawControlButtonEntity):
                 f"counter.{self._dog_name}_feeding_count",
             ]
 
-            for entity_id in counter_entities:
-                await self._safe_service_call(
-                    "counter", "reset", {"entity_id": entity_id}
-                )
+            await safe_batch_service_call(
+                self.hass, "counter", "reset", counter_entities
+            )
 
             _LOGGER.info("Daily data reset for %s", self._dog_name)
         except Exception as e:
@@ -270,7 +268,7 @@ class PawControlEmergencyButton(PawControlButtonEntity):
             coordinator,
             dog_name=dog_name,
             key="emergency",
-            icon=get_icon("emergency"),
+            icon=Icon.EMERGENCY,
         )
 
     async def async_press(self) -> None:
@@ -308,7 +306,7 @@ class PawControlVisitorModeButton(PawControlButtonEntity):
             coordinator,
             dog_name=dog_name,
             key="visitor_mode",
-            icon=get_icon("visitor"),
+            icon=Icon.VISITOR,
         )
 
     async def async_press(self) -> None:
@@ -369,7 +367,7 @@ class PawControlUpdateGPSButton(PawControlButtonEntity):
             coordinator,
             dog_name=dog_name,
             key="update_gps",
-            icon=get_icon("gps"),
+            icon=Icon.GPS,
         )
 
     async def async_press(self) -> None:
@@ -8,6 +8,7 @@ modular.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import voluptuous as vol
@@ -43,6 +44,13 @@ if TYPE_CHECKING:
 _FlowInputT = TypeVar("_FlowInputT", bound=dict[str, Any])
 
 
+@cache
+def _feeding_times_selector() -> cv.multi_select:
+    """Return the shared multi-select validator for feeding times."""
+
+    return cv.multi_select(FEEDING_TYPES)
+
+
 def _validate_schema[FlowInputT: dict[str, Any]](
     schema: vol.Schema, user_input: _FlowInputT
 ) -> tuple[_FlowInputT | None, dict[str, str]]:
@@ -82,7 +90,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             vol.Optional(
                 CONF_FEEDING_TIMES, default=list(DEFAULT_FEEDING_TIMES)
-            ): cv.multi_select(FEEDING_TYPES),
+            ): _feeding_times_selector(),
             vol.Optional(CONF_WALK_DURATION, default=DEFAULT_WALK_DURATION): vol.All(
                 vol.Coerce(int), vol.Range(min=0)
             ),
@@ -1,5 +1,13 @@
 """Konstanten für Paw Control."""
 
+import sys
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, fields
+from enum import IntEnum
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Final, NamedTuple
+
 DOMAIN = "pawcontrol"
 
 # Konfigurations-Keys (ConfigFlow, Options, Helper etc.)
@@ -16,31 +24,65 @@ CONF_HEALTH_MODULE = "health_module"
 CONF_WALK_MODULE = "walk_module"
 CONF_CREATE_DASHBOARD = "create_dashboard"
 
+
 # Sensors, States, Helper
-ATTR_LAST_FED = "last_fed"
-ATTR_LAST_WALK = "last_walk"
-ATTR_HEALTH_STATUS = "health_status"
-ATTR_GPS_LOCATION = "gps_location"
-ATTR_FEEDING_COUNTER = "feeding_counter"
-ATTR_WALK_COUNTER = "walk_counter"
-ATTR_PUSH_TARGET = "push_target"
-ATTR_PERSON_ID = "person_id"
-ATTR_ACTION = "action"
-ATTR_TIMESTAMP = "timestamp"
-ATTR_DEVICE_TRACKER = "device_tracker"
-ATTR_MEDICATION = "medication"
-ATTR_SYMPTOMS = "symptoms"
-ATTR_WEIGHT_HISTORY = "weight_history"
-ATTR_ACTIVITY_LOG = "activity_log"
-ATTR_LAST_EVENT = "last_event"
-ATTR_DASHBOARD_VIEW = "dashboard_view"
-ATTR_EVENT_TYPE = "event_type"
-ATTR_EVENT_DETAIL = "event_detail"
-ATTR_DOG_NAME = "dog_name"
-ATTR_LAST_UPDATED = "last_updated"
+class Attr:
+    """Attribut-Keys für Sensoren, States und Helper.
+
+    Die Werte bleiben einfache Strings, damit sie unverändert als Dict-Keys
+    und in JSON-Attributen verwendet werden können.
+    """
+
+    __slots__ = ()
+
+    LAST_FED = "last_fed"
+    LAST_WALK = "last_walk"
+    HEALTH_STATUS = "health_status"
+    GPS_LOCATION = "gps_location"
+    FEEDING_COUNTER = "feeding_counter"
+    WALK_COUNTER = "walk_counter"
+    PUSH_TARGET = "push_target"
+    PERSON_ID = "person_id"
+    ACTION = "action"
+    TIMESTAMP = "timestamp"
+    DEVICE_TRACKER = "device_tracker"
+    MEDICATION = "medication"
+    SYMPTOMS = "symptoms"
+    WEIGHT_HISTORY = "weight_history"
+    ACTIVITY_LOG = "activity_log"
+    LAST_EVENT = "last_event"
+    DASHBOARD_VIEW = "dashboard_view"
+    EVENT_TYPE = "event_type"
+    EVENT_DETAIL = "event_detail"
+    DOG_NAME = "dog_name"
+    LAST_UPDATED = "last_updated"
+
+
+# Flat aliases kept for existing imports
+ATTR_LAST_FED = Attr.LAST_FED
+ATTR_LAST_WALK = Attr.LAST_WALK
+ATTR_HEALTH_STATUS = Attr.HEALTH_STATUS
+ATTR_GPS_LOCATION = Attr.GPS_LOCATION
+ATTR_FEEDING_COUNTER = Attr.FEEDING_COUNTER
+ATTR_WALK_COUNTER = Attr.WALK_COUNTER
+ATTR_PUSH_TARGET = Attr.PUSH_TARGET
+ATTR_PERSON_ID = Attr.PERSON_ID
+ATTR_ACTION = Attr.ACTION
+ATTR_TIMESTAMP = Attr.TIMESTAMP
+ATTR_DEVICE_TRACKER = Attr.DEVICE_TRACKER
+ATTR_MEDICATION = Attr.MEDICATION
+ATTR_SYMPTOMS = Attr.SYMPTOMS
+ATTR_WEIGHT_HISTORY = Attr.WEIGHT_HISTORY
+ATTR_ACTIVITY_LOG = Attr.ACTIVITY_LOG
+ATTR_LAST_EVENT = Attr.LAST_EVENT
+ATTR_DASHBOARD_VIEW = Attr.DASHBOARD_VIEW
+ATTR_EVENT_TYPE = Attr.EVENT_TYPE
+ATTR_EVENT_DETAIL = Attr.EVENT_DETAIL
+ATTR_DOG_NAME = Attr.DOG_NAME
+ATTR_LAST_UPDATED = Attr.LAST_UPDATED
 
 # Standardwerte
-DEFAULT_FEEDING_TIMES = []
+DEFAULT_FEEDING_TIMES: tuple[str, ...] = ()
 DEFAULT_WALK_DURATION = 30
 DEFAULT_HEALTH_STATUS = "ok"
 DEFAULT_GPS_LOCATION = "unknown"
@@ -52,6 +94,9 @@ INPUT_NUMBER_PREFIX = "input_number"
 INPUT_TEXT_PREFIX = "input_text"
 COUNTER_PREFIX = "counter"
 
+# Zustände ohne verwertbaren Wert (``STATE_UNKNOWN`` / ``STATE_UNAVAILABLE``)
+INVALID_STATES: Final = frozenset({"unknown", "unavailable"})
+
 # Beispiel-Service-Namen
 SERVICE_FEED_DOG = "feed_dog"
 SERVICE_START_WALK = "start_walk"
@@ -73,13 +118,13 @@ SERVICE_MOOD = "mood"
 SERVICE_VET_DATE = "vet_date"
 
 # Für die optionale Modularisierung: Alle Feature-Flags zentral gesammelt
-ALL_MODULE_FLAGS = [
+ALL_MODULE_FLAGS = (
     CONF_GPS_ENABLE,
     CONF_NOTIFICATIONS_ENABLED,
     CONF_HEALTH_MODULE,
     CONF_WALK_MODULE,
     CONF_CREATE_DASHBOARD,
-]
+)
 
 # -----------------------------------------------------------------------------
 # Additional configuration and validation constants
@@ -97,169 +142,700 @@ MAX_DOG_AGE = 25
 DOG_NAME_PATTERN = r"^[a-zA-ZäöüÄÖÜß0-9\s\-_.]+$"
 
 # GPS related defaults
-GPS_ACCURACY_THRESHOLDS = {
-    "excellent": 5,
-    "good": 15,
-    "acceptable": 50,
-}
+GPS_ACCURACY_THRESHOLDS = MappingProxyType(
+    {
+        "excellent": 5,
+        "good": 15,
+        "acceptable": 50,
+    }
+)
 
 DEFAULT_HOME_COORDINATES = (0.0, 0.0)
 
-GPS_CONFIG = {
-    "movement_threshold": 3.0,
-    "stationary_time": 300,
-    "walk_detection_distance": 10.0,
-    "min_walk_duration": 5,
-    "home_zone_radius": 50,
-}
 
-GEOFENCE_MIN_RADIUS = 10
-GEOFENCE_MAX_RADIUS = 10000
-
-# Icon mapping used across the integration
-ICONS = {
-    "automation": "mdi:robot",
-    "battery": "mdi:battery",
-    "emergency": "mdi:alert",
-    "evening": "mdi:weather-night",
-    "food": "mdi:food",
-    "gps": "mdi:crosshairs-gps",
-    "grooming": "mdi:scissors-cutting",
-    "health": "mdi:heart",
-    "home": "mdi:home",
-    "location": "mdi:map-marker",
-    "lunch": "mdi:food",
-    "medication": "mdi:pill",
-    "mood": "mdi:emoticon",
-    "morning": "mdi:weather-sunny",
-    "outside": "mdi:dog-side",
-    "play": "mdi:tennis-ball",
-    "poop": "mdi:dog-side",
-    "settings": "mdi:cog",
-    "signal": "mdi:signal",
-    "statistics": "mdi:chart-bar",
-    "status": "mdi:information",
-    "temperature": "mdi:thermometer",
-    "training": "mdi:school",
-    "vet": "mdi:stethoscope",
-    "visitor": "mdi:account-group",
-    "walk": "mdi:walk",
-    "weight": "mdi:weight",
-}
+@dataclass(frozen=True, slots=True)
+class GpsTuning:
+    """Zentrale Schwellwerte für GPS-Tracking und Geofencing."""
+
+    movement_threshold: float = 3.0  # m between fixes that count as movement
+    stationary_time: int = 300  # s without movement before "stationary"
+    walk_detection_distance: float = 10.0  # m from home to auto-start a walk
+    min_walk_duration: int = 5  # min for an auto-detected walk to count
+    home_zone_radius: int = 50  # m, default home geofence
+    geofence_min_radius: int = 10
+    geofence_max_radius: int = 10000
+
+
+GPS = GpsTuning()
+
+# Mapping and scalar aliases of ``GPS`` kept for existing imports
+GPS_CONFIG = MappingProxyType(
+    {
+        "movement_threshold": GPS.movement_threshold,
+        "stationary_time": GPS.stationary_time,
+        "walk_detection_distance": GPS.walk_detection_distance,
+        "min_walk_duration": GPS.min_walk_duration,
+        "home_zone_radius": GPS.home_zone_radius,
+    }
+)
+
+GEOFENCE_MIN_RADIUS = GPS.geofence_min_radius
+GEOFENCE_MAX_RADIUS = GPS.geofence_max_radius
+
+
+def _intern_values(mapping: dict[str, Any]) -> dict[str, Any]:
+    """Interniere alle String-Werte einer (verschachtelten) Konfiguration.
+
+    Wiederholte Werte wie Icons oder Einheiten teilen sich so ein Objekt, und
+    Vergleiche können über den Identitäts-Fastpath laufen.
+    """
+    for key, value in mapping.items():
+        if isinstance(value, str):
+            mapping[key] = sys.intern(value)
+        elif isinstance(value, dict):
+            _intern_values(value)
+        elif type(value) is tuple and all(isinstance(item, str) for item in value):
+            mapping[key] = _options(*value)
+    return mapping
+
+
+def _options(*values: str) -> tuple[str, ...]:
+    """Erzeuge ein unveränderliches Options-Tupel aus internierten Strings."""
+    return tuple(sys.intern(value) for value in values)
+
+
+class Icon:
+    """Icons, die in der gesamten Integration verwendet werden.
+
+    Attributzugriffe wie ``Icon.WALK`` laufen über das Klassen-Dict und werden
+    vom Interpreter gecacht; ``ICONS`` bleibt als Mapping für dynamische Keys.
+    """
+
+    __slots__ = ()
+
+    AUTOMATION = "mdi:robot"
+    BATTERY = "mdi:battery"
+    COUNTER = "mdi:counter"
+    EMERGENCY = "mdi:alert"
+    EVENING = "mdi:weather-night"
+    FOOD = "mdi:food"
+    GPS = "mdi:crosshairs-gps"
+    GROOMING = "mdi:scissors-cutting"
+    HEALTH = "mdi:heart"
+    HOME = "mdi:home"
+    LOCATION = "mdi:map-marker"
+    LUNCH = "mdi:food"
+    MEDICATION = "mdi:pill"
+    MOOD = "mdi:emoticon"
+    MORNING = "mdi:weather-sunny"
+    NOTES = "mdi:note-text"
+    OUTSIDE = "mdi:dog-side"
+    PLAY = "mdi:tennis-ball"
+    POOP = "mdi:dog-side"
+    SETTINGS = "mdi:cog"
+    SIGNAL = "mdi:signal"
+    STATISTICS = "mdi:chart-bar"
+    STATUS = "mdi:information"
+    TEMPERATURE = "mdi:thermometer"
+    TRAINING = "mdi:school"
+    VET = "mdi:stethoscope"
+    VISITOR = "mdi:account-group"
+    WALK = "mdi:walk"
+    WEIGHT = "mdi:weight"
+
+
+class Unit:
+    """Maßeinheiten der Integration als geteilte Konstanten.
+
+    Home Assistant erwartet Einheiten als Strings; die Klasse sorgt dafür,
+    dass jede Einheit nur einmal definiert und überall dasselbe Objekt ist.
+    """
+
+    __slots__ = ()
+
+    BPM = "bpm"
+    CELSIUS = "°C"
+    GRAMS = "g"
+    KCAL = "kcal"
+    KILOGRAMS = "kg"
+    KILOMETERS = "km"
+    KM_PER_HOUR = "km/h"
+    METERS = "m"
+    MINUTES = "min"
+    PERCENT = "%"
+    YEARS = "years"
+    YEARS_DE = "Jahre"
+
+
+# Lookup by lower-case key for dynamic access. ``ICON_<KEY>`` names are served
+# by the module ``__getattr__`` below instead of separate module globals.
+ICONS = MappingProxyType(
+    _intern_values(
+        {
+            name.lower(): value
+            for name, value in vars(Icon).items()
+            if not name.startswith("_")
+        }
+    )
+)
 
 # Feeding and meal definitions
-FEEDING_TYPES = ["morning", "lunch", "evening", "snack"]
-MEAL_TYPES = {
-    "morning": "Frühstück",
-    "lunch": "Mittag",
-    "evening": "Abend",
-    "snack": "Snack",
-}
+FEEDING_TYPES: Final[tuple[str, ...]] = _options("morning", "lunch", "evening", "snack")
+MEAL_TYPES: Final[Mapping[str, str]] = MappingProxyType(
+    _intern_values(
+        {
+            "morning": "Frühstück",
+            "lunch": "Mittag",
+            "evening": "Abend",
+            "snack": "Snack",
+        }
+    )
+)
+MEAL_ICONS = MappingProxyType(
+    {
+        "morning": Icon.MORNING,
+        "lunch": Icon.LUNCH,
+        "evening": Icon.EVENING,
+        "snack": Icon.FOOD,
+    }
+)
 
-# Status texts used by automations and scripts
-STATUS_MESSAGES = {
-    "ok": "Alles ok",
-    "needs_food": "Fütterung ausstehend",
-    "needs_walk": "Spaziergang ausstehend",
-}
 
-# Generic validation rules for numeric service data
-VALIDATION_RULES = {
-    "weight": {"min": MIN_DOG_WEIGHT, "max": MAX_DOG_WEIGHT, "unit": "kg"},
-    "age": {"min": MIN_DOG_AGE, "max": MAX_DOG_AGE, "unit": "years"},
+class _Activity(NamedTuple):
+    """Einheitlicher Datensatz für eine protokollierbare Aktivität."""
+
+    name: str
+    icon: str
+    tracks_last_time: bool = False
+
+
+# Activities known to the activity logger. Every entry has the same shape so
+# consumers can use plain attribute access without type dispatch.
+ACTIVITY_TYPES = MappingProxyType(
+    {
+        "walk": _Activity("Walk", ICONS["walk"], tracks_last_time=True),
+        "feeding": _Activity("Feeding", ICONS["food"], tracks_last_time=True),
+        "outside": _Activity("Outside", ICONS["outside"], tracks_last_time=True),
+        "poop": _Activity("Potty", ICONS["poop"], tracks_last_time=True),
+        "play": _Activity("Play", ICONS["play"]),
+        "training": _Activity("Training", ICONS["training"]),
+        "medication": _Activity("Medication", ICONS["medication"]),
+        "health_check": _Activity("Health check", ICONS["health"]),
+    }
+)
+
+# Auswahloptionen für Select-Entities. Die Tupel definieren die Anzeige-
+# reihenfolge, die ``frozenset``-Begleiter erlauben O(1)-Mitgliedschaftstests
+# bei der Validierung von Benutzereingaben.
+ACTIVITY_LEVELS = _options("Sehr niedrig", "Niedrig", "Normal", "Hoch", "Sehr hoch")
+HEALTH_STATUS_OPTIONS = _options(
+    "Ausgezeichnet", "Sehr gut", "Gut", "Normal", "Unwohl", "Krank", "Notfall"
+)
+MOOD_OPTIONS = _options(
+    "😊 Glücklich",
+    "😐 Neutral",
+    "😴 Müde",
+    "😟 Gestresst",
+    "😠 Gereizt",
+    "🤒 Krank",
+)
+ENERGY_LEVEL_OPTIONS = _options(
+    "Sehr niedrig", "Niedrig", "Normal", "Hoch", "Sehr hoch"
+)
+APPETITE_LEVEL_OPTIONS = _options(
+    "Kein Appetit", "Wenig Appetit", "Normal", "Guter Appetit", "Sehr guter Appetit"
+)
+EMERGENCY_LEVELS = _options("Normal", "Aufmerksamkeit", "Dringend", "Notfall")
+TRAINING_TYPES = _options(
+    "Grundgehorsam", "Tricks", "Agility", "Rückruf", "Leinenführigkeit"
+)
+WALK_TYPES = _options("Normal", "Kurz", "Lang", "Training", "Freilauf")
+SIZE_CATEGORIES = _options(
+    "Klein (<10kg)", "Mittel (10-25kg)", "Groß (25-45kg)", "Riesig (>45kg)"
+)
+GPS_SOURCE_TYPES = _options(
+    "Manual",
+    "Smartphone",
+    "Device Tracker",
+    "Person Entity",
+    "Tractive",
+    "Webhook",
+    "MQTT",
+)
+
+_ACTIVITY_LEVELS_SET = frozenset(ACTIVITY_LEVELS)
+_HEALTH_STATUS_SET = frozenset(HEALTH_STATUS_OPTIONS)
+_MOOD_SET = frozenset(MOOD_OPTIONS)
+_ENERGY_LEVEL_SET = frozenset(ENERGY_LEVEL_OPTIONS)
+_APPETITE_LEVEL_SET = frozenset(APPETITE_LEVEL_OPTIONS)
+_EMERGENCY_LEVELS_SET = frozenset(EMERGENCY_LEVELS)
+_TRAINING_TYPES_SET = frozenset(TRAINING_TYPES)
+_WALK_TYPES_SET = frozenset(WALK_TYPES)
+_SIZE_CATEGORIES_SET = frozenset(SIZE_CATEGORIES)
+_FEEDING_TYPES_SET = frozenset(FEEDING_TYPES)
+_GPS_SOURCE_TYPES_SET = frozenset(GPS_SOURCE_TYPES)
+
+is_valid_activity_level = _ACTIVITY_LEVELS_SET.__contains__
+is_valid_health_status = _HEALTH_STATUS_SET.__contains__
+is_valid_mood = _MOOD_SET.__contains__
+is_valid_energy_level = _ENERGY_LEVEL_SET.__contains__
+is_valid_appetite_level = _APPETITE_LEVEL_SET.__contains__
+is_valid_emergency_level = _EMERGENCY_LEVELS_SET.__contains__
+is_valid_training_type = _TRAINING_TYPES_SET.__contains__
+is_valid_walk_type = _WALK_TYPES_SET.__contains__
+is_valid_size_category = _SIZE_CATEGORIES_SET.__contains__
+is_valid_feeding_type = _FEEDING_TYPES_SET.__contains__
+is_valid_gps_source_type = _GPS_SOURCE_TYPES_SET.__contains__
+
+# Shared membership sets keyed by their option tuple
+_OPTION_SETS: Mapping[tuple[str, ...], frozenset[str]] = MappingProxyType(
+    {
+        ACTIVITY_LEVELS: _ACTIVITY_LEVELS_SET,
+        HEALTH_STATUS_OPTIONS: _HEALTH_STATUS_SET,
+        MOOD_OPTIONS: _MOOD_SET,
+        ENERGY_LEVEL_OPTIONS: _ENERGY_LEVEL_SET,
+        APPETITE_LEVEL_OPTIONS: _APPETITE_LEVEL_SET,
+        EMERGENCY_LEVELS: _EMERGENCY_LEVELS_SET,
+        TRAINING_TYPES: _TRAINING_TYPES_SET,
+        WALK_TYPES: _WALK_TYPES_SET,
+        SIZE_CATEGORIES: _SIZE_CATEGORIES_SET,
+        FEEDING_TYPES: _FEEDING_TYPES_SET,
+        GPS_SOURCE_TYPES: _GPS_SOURCE_TYPES_SET,
+    }
+)
+
+
+def get_option_set(options: tuple[str, ...] | list[str]) -> frozenset[str]:
+    """Gib den geteilten ``frozenset``-Begleiter einer Optionsliste zurück."""
+    if type(options) is tuple:
+        option_set = _OPTION_SETS.get(options)
+        if option_set is not None:
+            return option_set
+    return frozenset(options)
+
+
+class HealthStatus(IntEnum):
+    """Gesundheitsstatus, aufsteigend nach Schweregrad.
+
+    Der Wert ist zugleich der Index des Labels in ``HEALTH_STATUS_OPTIONS``.
+    """
+
+    EXCELLENT = 0
+    VERY_GOOD = 1
+    GOOD = 2
+    NORMAL = 3
+    UNWELL = 4
+    SICK = 5
+    EMERGENCY = 6
+
+    @property
+    def label(self) -> str:
+        """Anzeigetext des Status."""
+        return HEALTH_STATUS_OPTIONS[self]
+
+
+def _build_health_status_by_label() -> Mapping[str, HealthStatus]:
+    """Ordne jedem Label aus ``HEALTH_STATUS_OPTIONS`` seinen Status zu."""
+    return MappingProxyType(
+        {
+            label: HealthStatus(index)
+            for index, label in enumerate(HEALTH_STATUS_OPTIONS)
+        }
+    )
+
+
+# Status texts used by automations and scripts, indexed by ``DogStatus``
+STATUS_MESSAGE_TEXTS = _options(
+    "Alles ok", "Fütterung ausstehend", "Spaziergang ausstehend"
+)
+
+
+class DogStatus(IntEnum):
+    """Status-Kennungen; der Wert indiziert ``STATUS_MESSAGE_TEXTS``."""
+
+    OK = 0
+    NEEDS_FOOD = 1
+    NEEDS_WALK = 2
+
+    @property
+    def message(self) -> str:
+        """Anzeigetext des Status."""
+        return STATUS_MESSAGE_TEXTS[self]
+
+
+# Lookup by lower-case key for callers that pass the status as a string
+STATUS_MESSAGES = MappingProxyType(
+    {status.name.lower(): STATUS_MESSAGE_TEXTS[status] for status in DogStatus}
+)
+
+
+class _Range(NamedTuple):
+    """Unveränderlicher Wertebereich für numerische Werte."""
+
+    min: float
+    max: float
+    unit: str
+    step: float = 1
+
+
+# Shared range flyweights, referenced by identity from the validation rules
+# and the ``input_number`` blueprints instead of repeating min/max/step/unit.
+RANGE_WEIGHT = _Range(MIN_DOG_WEIGHT, MAX_DOG_WEIGHT, Unit.KILOGRAMS, 0.1)
+RANGE_AGE = _Range(MIN_DOG_AGE, MAX_DOG_AGE, Unit.YEARS, 1)
+
+
+class VRule(IntEnum):
+    """Index der Validierungsbereiche in ``VALIDATION_RANGES``."""
+
+    WEIGHT = 0
+    AGE = 1
+
+
+# Validation ranges indexed by ``VRule``; a plain tuple index replaces the
+# string-keyed lookup for callers that know the field at import time.
+VALIDATION_RANGES: Final[tuple[_Range, ...]] = (RANGE_WEIGHT, RANGE_AGE)
+
+# Generic validation rules for numeric service data, keyed by field name
+VALIDATION_RULES: Final[Mapping[str, _Range]] = MappingProxyType(
+    {rule.name.lower(): VALIDATION_RANGES[rule] for rule in VRule}
+)
+
+# Vital signs outside these (exclusive) bounds indicate an emergency
+VITAL_SIGN_RANGES = MappingProxyType(
+    {
+        "temperature": _Range(37.0, 41.0, Unit.CELSIUS),
+        "heart_rate": _Range(50, 180, Unit.BPM),
+    }
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _HelperSpec:
+    """Vorlage für einen Helper; Basis der plattformspezifischen Specs."""
+
+    name: str
+    icon: str = "mdi:dog"
+
+    def __post_init__(self) -> None:
+        """Interniere String-Felder wie ``_intern_values`` bei den Tabellen."""
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if isinstance(value, str):
+                object.__setattr__(self, field.name, sys.intern(value))
+            elif type(value) is tuple and all(isinstance(item, str) for item in value):
+                object.__setattr__(self, field.name, _options(*value))
+
+    def __getitem__(self, key: str) -> Any:
+        """Erlaube den bisherigen Dict-Zugriff ``spec["name"]``."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-kompatibler Zugriff mit Default."""
+        return getattr(self, key, default)
+
+    def create_data(self, name: str) -> dict[str, Any]:
+        """Service-Daten für ``<platform>.create`` mit Anzeigename ``name``."""
+        return {"name": name, "icon": self.icon}
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _CounterSpec(_HelperSpec):
+    """Vorlage für einen ``counter``-Helper."""
+
+    initial: int = 0
+    step: int = 1
+
+    def create_data(self, name: str) -> dict[str, Any]:
+        """Service-Daten für ``counter.create``."""
+        return {
+            "name": name,
+            "initial": self.initial,
+            "step": self.step,
+            "minimum": 0,
+            "maximum": 999999,
+            "icon": self.icon,
+            "restore": True,
+        }
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _TextSpec(_HelperSpec):
+    """Vorlage für einen ``input_text``-Helper."""
+
+    max: int = 255
+
+    def create_data(self, name: str) -> dict[str, Any]:
+        """Service-Daten für ``input_text.create``."""
+        return {"name": name, "max": self.max, "icon": self.icon, "mode": "text"}
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _DateTimeSpec(_HelperSpec):
+    """Vorlage für einen ``input_datetime``-Helper."""
+
+    has_date: bool = True
+    has_time: bool = True
+    initial: str | None = None
+
+    def create_data(self, name: str) -> dict[str, Any]:
+        """Service-Daten für ``input_datetime.create``."""
+        data = {
+            "name": name,
+            "has_date": self.has_date,
+            "has_time": self.has_time,
+            "icon": self.icon,
+        }
+        if self.initial is not None:
+            data["initial"] = self.initial
+        return data
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _NumberSpec(_HelperSpec):
+    """Vorlage für einen ``input_number``-Helper mit geteiltem Wertebereich."""
+
+    value_range: _Range
+    initial: float | None = None
+
+    def create_data(self, name: str) -> dict[str, Any]:
+        """Service-Daten für ``input_number.create``."""
+        value_range = self.value_range
+        data = {
+            "name": name,
+            "min": value_range.min,
+            "max": value_range.max,
+            "step": value_range.step,
+            "unit_of_measurement": value_range.unit,
+            "icon": self.icon,
+            "mode": "slider",
+        }
+        if self.initial is not None:
+            data["initial"] = self.initial
+        return data
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _SelectSpec(_HelperSpec):
+    """Vorlage für einen ``input_select``-Helper."""
+
+    options: tuple[str, ...]
+    initial: str | None = None
+
+    def create_data(self, name: str) -> dict[str, Any]:
+        """Service-Daten für ``input_select.create``."""
+        data = {"name": name, "options": list(self.options), "icon": self.icon}
+        if self.initial is not None:
+            data["initial"] = self.initial
+        return data
+
+
+def _build_input_boolean_specs() -> dict[str, _HelperSpec]:
+    """Vorlage der ``input_boolean``-Helper."""
+    return {
+        "feeding_morning": _HelperSpec(name="Frühstück gegeben", icon=Icon.FOOD),
+        "feeding_lunch": _HelperSpec(name="Mittagessen gegeben", icon=Icon.FOOD),
+        "feeding_evening": _HelperSpec(name="Abendessen gegeben", icon=Icon.FOOD),
+        "feeding_snack": _HelperSpec(name="Snack gegeben", icon=Icon.FOOD),
+        "walk_in_progress": _HelperSpec(name="Spaziergang läuft", icon=Icon.WALK),
+    }
+
+
+def _build_counter_specs() -> dict[str, _HelperSpec]:
+    """Vorlage der ``counter``-Helper."""
+    return {
+        "walk_count": _CounterSpec(name="Spaziergänge", icon=Icon.WALK),
+        "feeding_morning_count": _CounterSpec(
+            name="Frühstücks-Zähler", icon=Icon.COUNTER
+        ),
+        "feeding_lunch_count": _CounterSpec(
+            name="Mittagessens-Zähler", icon=Icon.COUNTER
+        ),
+        "feeding_evening_count": _CounterSpec(
+            name="Abendessens-Zähler", icon=Icon.COUNTER
+        ),
+        "feeding_snack_count": _CounterSpec(name="Snack-Zähler", icon=Icon.COUNTER),
+    }
+
+
+def _build_input_text_specs() -> dict[str, _HelperSpec]:
+    """Vorlage der ``input_text``-Helper."""
+    return {
+        "notes": _TextSpec(name="Notizen", max=255, icon=Icon.NOTES),
+    }
+
+
+def _build_input_datetime_specs() -> dict[str, _HelperSpec]:
+    """Vorlage der ``input_datetime``-Helper."""
+    return {
+        "last_walk": _DateTimeSpec(name="Letzter Spaziergang", icon=Icon.WALK),
+        "last_feeding_morning": _DateTimeSpec(name="Letztes Frühstück", icon=Icon.FOOD),
+        "last_feeding_lunch": _DateTimeSpec(name="Letztes Mittagessen", icon=Icon.FOOD),
+        "last_feeding_evening": _DateTimeSpec(
+            name="Letztes Abendessen", icon=Icon.FOOD
+        ),
+        "last_feeding_snack": _DateTimeSpec(name="Letzter Snack", icon=Icon.FOOD),
+    }
+
+
+def _build_input_number_specs() -> dict[str, _HelperSpec]:
+    """Vorlage der ``input_number``-Helper."""
+    return {
+        "weight": _NumberSpec(
+            name="Gewicht", value_range=RANGE_WEIGHT, icon=Icon.WEIGHT
+        ),
+    }
+
+
+def _build_input_select_specs() -> dict[str, _HelperSpec]:
+    """Vorlage der ``input_select``-Helper."""
+    return {
+        "health_status": _SelectSpec(
+            name="Gesundheitsstatus",
+            options=_options("gut", "mittel", "schlecht"),
+            icon=Icon.HEALTH,
+        ),
+    }
+
+
+# Blueprint builders per helper platform, in creation order. Each platform is
+# built on first use, so looking up one platform leaves the others unbuilt.
+_PLATFORM_BUILDERS: dict[str, Callable[[], dict[str, _HelperSpec]]] = {
+    "input_boolean": _build_input_boolean_specs,
+    "counter": _build_counter_specs,
+    "input_text": _build_input_text_specs,
+    "input_datetime": _build_input_datetime_specs,
+    "input_number": _build_input_number_specs,
+    "input_select": _build_input_select_specs,
 }
 
-# Default entity blueprint used when creating helper entities
-ENTITIES = {
-    "input_boolean": {
-        "feeding_morning": {"name": "Frühstück gegeben", "icon": "mdi:food"},
-        "feeding_lunch": {"name": "Mittagessen gegeben", "icon": "mdi:food"},
-        "feeding_evening": {"name": "Abendessen gegeben", "icon": "mdi:food"},
-        "feeding_snack": {"name": "Snack gegeben", "icon": "mdi:food"},
-        "walk_in_progress": {"name": "Spaziergang läuft", "icon": "mdi:walk"},
-    },
-    "counter": {
-        "walk_count": {
-            "name": "Spaziergänge",
-            "initial": 0,
-            "step": 1,
-            "icon": "mdi:walk",
-        },
-        "feeding_morning_count": {
-            "name": "Frühstücks-Zähler",
-            "initial": 0,
-            "step": 1,
-            "icon": "mdi:counter",
-        },
-        "feeding_lunch_count": {
-            "name": "Mittagessens-Zähler",
-            "initial": 0,
-            "step": 1,
-            "icon": "mdi:counter",
-        },
-        "feeding_evening_count": {
-            "name": "Abendessens-Zähler",
-            "initial": 0,
-            "step": 1,
-            "icon": "mdi:counter",
-        },
-        "feeding_snack_count": {
-            "name": "Snack-Zähler",
-            "initial": 0,
-            "step": 1,
-            "icon": "mdi:counter",
-        },
-    },
-    "input_text": {
-        "notes": {"name": "Notizen", "max": 255, "icon": "mdi:note-text"},
-    },
-    "input_datetime": {
-        "last_walk": {
-            "name": "Letzter Spaziergang",
-            "has_date": True,
-            "has_time": True,
-            "icon": "mdi:walk",
-        },
-        "last_feeding_morning": {
-            "name": "Letztes Frühstück",
-            "has_date": True,
-            "has_time": True,
-            "icon": "mdi:food",
-        },
-        "last_feeding_lunch": {
-            "name": "Letztes Mittagessen",
-            "has_date": True,
-            "has_time": True,
-            "icon": "mdi:food",
-        },
-        "last_feeding_evening": {
-            "name": "Letztes Abendessen",
-            "has_date": True,
-            "has_time": True,
-            "icon": "mdi:food",
-        },
-        "last_feeding_snack": {
-            "name": "Letzter Snack",
-            "has_date": True,
-            "has_time": True,
-            "icon": "mdi:food",
-        },
-    },
-    "input_number": {
-        "weight": {
-            "name": "Gewicht",
-            "min": MIN_DOG_WEIGHT,
-            "max": MAX_DOG_WEIGHT,
-            "step": 0.1,
-            "unit": "kg",
-            "icon": "mdi:weight",
-        },
-    },
-    "input_select": {
-        "health_status": {
-            "name": "Gesundheitsstatus",
-            "options": ["gut", "mittel", "schlecht"],
-            "icon": "mdi:heart",
-        },
-    },
+
+@cache
+def _platform_specs(platform: str) -> dict[str, _HelperSpec]:
+    """Baue die Vorlage einer bekannten Plattform einmalig."""
+    return _PLATFORM_BUILDERS[platform]()
+
+
+@cache
+def _platform_view(platform: str) -> Mapping[str, _HelperSpec]:
+    """Schreibgeschützte Sicht auf die Vorlage einer Plattform."""
+    return MappingProxyType(_platform_specs(platform))
+
+
+class _BlueprintView(Mapping[str, Mapping[str, _HelperSpec]]):
+    """Schreibgeschützte Sicht auf die Helper-Vorlage aller Plattformen.
+
+    Es wird kein äußeres Dict aufgebaut; ``view[platform]`` baut nur die
+    angefragte Plattform und liefert eine ``MappingProxyType``-Sicht darauf.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, platform: str) -> Mapping[str, _HelperSpec]:
+        if platform not in _PLATFORM_BUILDERS:
+            raise KeyError(platform)
+        return _platform_view(platform)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_PLATFORM_BUILDERS)
+
+    def __len__(self) -> int:
+        return len(_PLATFORM_BUILDERS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(_PLATFORM_BUILDERS)})"
+
+
+# Standard-Vorlage für Helper-Entities, je Plattform beim ersten Zugriff gebaut
+ENTITIES: Final[Mapping[str, Mapping[str, _HelperSpec]]] = _BlueprintView()
+
+
+def _build_entities_by_platform() -> Mapping[str, tuple[tuple[str, _HelperSpec], ...]]:
+    """Gruppiere ``ENTITIES`` einmalig zu ``(suffix, config)``-Tupeln."""
+    return MappingProxyType(
+        {platform: get_entities(platform) for platform in _PLATFORM_BUILDERS}
+    )
+
+
+@cache
+def _entity_items(platform: str) -> tuple[tuple[str, _HelperSpec], ...]:
+    """Gruppiere die Vorlage einer Plattform zu ``(suffix, config)``-Tupeln."""
+    return tuple(_platform_specs(platform).items())
+
+
+def get_entities(platform: str) -> tuple[tuple[str, _HelperSpec], ...]:
+    """Gib die vorgruppierten Helper-Definitionen für ``platform`` zurück."""
+    if platform not in _PLATFORM_BUILDERS:
+        return ()
+    return _entity_items(platform)
+
+
+class _EntityColumns(NamedTuple):
+    """Spaltenweise Sicht (SoA) auf die Helper-Definitionen einer Plattform."""
+
+    suffixes: tuple[str, ...]
+    names: tuple[str, ...]
+    icons: tuple[str, ...]
+    configs: tuple[_HelperSpec, ...]
+
+
+_NO_COLUMNS = _EntityColumns((), (), (), ())
+
+
+def _build_entity_columns() -> Mapping[str, _EntityColumns]:
+    """Zerlege ``ENTITIES`` einmalig in parallele Spalten je Plattform."""
+    return MappingProxyType(
+        {platform: get_entity_columns(platform) for platform in _PLATFORM_BUILDERS}
+    )
+
+
+@cache
+def _entity_columns(platform: str) -> _EntityColumns:
+    """Zerlege die Vorlage einer Plattform in parallele Spalten."""
+    group = _platform_specs(platform)
+    return _EntityColumns(
+        tuple(group),
+        tuple(config.name for config in group.values()),
+        tuple(config.icon for config in group.values()),
+        tuple(group.values()),
+    )
+
+
+def get_entity_columns(platform: str) -> _EntityColumns:
+    """Gib die Spalten-Sicht der Helper-Definitionen für ``platform`` zurück."""
+    if platform not in _PLATFORM_BUILDERS:
+        return _NO_COLUMNS
+    return _entity_columns(platform)
+
+
+# Lazily built module attributes: name -> builder. The result replaces the
+# entry in the module namespace so later lookups bypass ``__getattr__``.
+_LAZY_BUILDERS: dict[str, Callable[[], Any]] = {
+    "ENTITIES_BY_PLATFORM": _build_entities_by_platform,
+    "ENTITY_COLUMNS": _build_entity_columns,
+    "HEALTH_STATUS_BY_LABEL": _build_health_status_by_label,
 }
+
+
+def _lazy(name: str) -> Any:
+    """Lies eine Lazy-Konstante aus dem Modul und baue sie bei Bedarf."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+def __getattr__(name: str) -> Any:
+    """Baue Lazy-Konstanten beim ersten Zugriff und löse ``ICON_<KEY>`` auf."""
+    builder = _LAZY_BUILDERS.get(name)
+    if builder is not None:
+        value = globals()[name] = builder()
+        return value
+    if name.startswith("ICON_"):
+        icon = ICONS.get(name[5:].lower())
+        if icon is not None:
+            return icon
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -3,23 +3,106 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+import sys
+from datetime import timedelta
+from functools import cached_property
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util.dt import utcnow
 
 from .const import CONF_DOG_NAME, DOMAIN
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant, State
 
 _LOGGER = logging.getLogger(__name__)
 
+# (key, platform) of every helper entity read during one update cycle
+_TRACKED_ENTITIES = (
+    ("feeding_morning", "input_boolean"),
+    ("feeding_evening", "input_boolean"),
+    ("last_feeding", "input_datetime"),
+    ("outside", "input_boolean"),
+    ("walked_today", "input_boolean"),
+    ("poop_done", "input_boolean"),
+    ("last_walk", "input_datetime"),
+    ("walk_count", "counter"),
+    ("weight", "input_number"),
+    ("health_notes", "input_text"),
+    ("current_location", "input_text"),
+    ("gps_signal_strength", "input_number"),
+)
+
+# Interned toggle state; Home Assistant's own "on" states are the same object
+_ON = sys.intern("on")
+
+
+def _is_on(state: State) -> bool:
+    """Return whether a toggle helper is on, via identity before ``==``."""
+    value = state.state
+    return value is _ON or value == _ON
+
+
+# Shared stand-in for a missing status section
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Repeated failures only log a full traceback every this many occurrences
+_ERROR_LOG_EVERY = 100
+
+# Seconds to wait for further helper changes before refreshing
+_REFRESH_COOLDOWN = 0.3
+
+# Status summaries indexed by ``fed << 2 | walked << 1 | outside``; interned so
+# every sensor state written from them shares one string object
+_STATUS_SUMMARIES = tuple(
+    map(
+        sys.intern,
+        (
+            "⏰ Fütterung & Spaziergang ausstehend",
+            "⏰ Fütterung & Spaziergang ausstehend",
+            "🍽️ Fütterung ausstehend",
+            "🍽️ Fütterung ausstehend",
+            "🚶 Spaziergang ausstehend",
+            "📝 Teilweise erledigt",
+            "📝 Teilweise erledigt",
+            "✅ Alles erledigt",
+        ),
+    )
+)
+
+# Happiness states indexed by ``fed << 1 | walked``
+_HAPPINESS = tuple(
+    map(
+        sys.intern,
+        ("Needs attention", "Needs attention", "Needs attention", "Happy"),
+    )
+)
+
 
 class PawControlCoordinator(DataUpdateCoordinator):
     """Simplified coordinator for Paw Control."""
 
+    # The base class keeps its ``__dict__``; the per-dog state lives in slots
+    __slots__ = (
+        "_data",
+        "_dirty",
+        "_err_counts",
+        "_num_cache",
+        "_state_debouncer",
+        "_summary_cache",
+        "data_version",
+        "dog_name",
+        "entry",
+    )
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -30,163 +113,272 @@ class PawControlCoordinator(DataUpdateCoordinator):
         )
         self.dog_name = entry.data[CONF_DOG_NAME]
         self.entry = entry
+        # Set whenever a tracked helper changes; a clean cycle reuses ``self.data``
+        self._dirty = True
+        # entity_id -> (raw state string, parsed value) of numeric helpers
+        self._num_cache: dict[str, tuple[str, int | float | None]] = {}
+        # Status summary of the current ``self.data``, reset whenever it is replaced
+        self._summary_cache: str | None = None
+        # Consecutive failures per error site, used to throttle tracebacks
+        self._err_counts: dict[str, int] = {}
+        # Bumped per rebuilt payload; entities skip re-reading an unchanged one
+        self.data_version = 0
+        # Collapse bursts of helper changes (e.g. a script setting several
+        # feeding helpers at once) into a single refresh. Only the listener
+        # goes through it; ``async_request_refresh`` keeps the default debouncer
+        self._state_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
+        entry.async_on_unload(self._state_debouncer.async_cancel)
+        entry.async_on_unload(
+            async_track_state_change_event(
+                hass, list(self._entity_ids.values()), self._async_on_state_change
+            )
+        )
+
+    @callback
+    def _async_on_state_change(self, _event: Event) -> None:
+        """Flag the cached data as stale and request a debounced refresh."""
+        self._dirty = True
+        self.hass.async_create_task(self._state_debouncer.async_call())
+
+    @property
+    def data(self) -> dict[str, Any] | None:
+        """The current payload, as published by the last refresh or push."""
+        return self._data
+
+    @data.setter
+    def data(self, value: dict[str, Any] | None) -> None:
+        # Every new payload invalidates the summary derived from the old one
+        self._data = value
+        self._summary_cache = None
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Publish pushed data and mark it as a new version for entities."""
+        self.data_version += 1
+        # The data setter drops the cached summary along with the old payload.
+        # The base class cancels only its request debouncer; a rebuild pending
+        # on ``_state_debouncer`` after a helper change still runs
+        super().async_set_updated_data(data)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from entities."""
+        if not self._dirty and self.data:
+            return self.data
+
+        # Cleared before reading so a change during the rebuild re-flags it
+        self._dirty = False
         try:
+            states = self._snapshot_states()
             data = {
                 "dog_name": self.dog_name,
-                "last_updated": datetime.now().isoformat(),
-                "feeding_status": await self._get_feeding_status(),
-                "activity_status": await self._get_activity_status(),
-                "health_status": await self._get_health_status(),
-                "location_status": await self._get_location_status(),
+                # Kept as a datetime; diagnostics serialise it on demand
+                "last_updated": utcnow(),
+                "feeding_status": self._get_feeding_status(states),
+                "activity_status": self._get_activity_status(states),
+                "health_status": self._get_health_status(states),
+                "location_status": self._get_location_status(states),
             }
 
             data["happiness_status"] = self._calculate_happiness(data)
+            # Carry the values entities pushed back (async_set_updated_data)
+            for key, value in (self.data or _EMPTY).items():
+                data.setdefault(key, value)
 
-            return data
-
-        except Exception as e:
-            _LOGGER.exception("Error updating data for %s: %s", self.dog_name, e)
+        # Only the failures the snapshot and readers can raise on odd helper
+        # states; anything else is a bug and propagates to the base class
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            self._dirty = True
+            self._log_error(
+                "update", "Error updating data for %s: %s", self.dog_name, e
+            )
             return {}
 
-    async def _get_feeding_status(self) -> dict[str, Any]:
-        """Get feeding status."""
+        self._err_counts.pop("update", None)
+        self.data_version += 1
+        return data
+
+    def _log_error(self, key: str, msg: str, *args: Any) -> None:
+        """Log the first and every ``_ERROR_LOG_EVERY``-th failure with a traceback.
+
+        Must be called from an ``except`` block; other repeats of the same
+        persistent fault are demoted to debug messages.
+        """
+        count = self._err_counts[key] = self._err_counts.get(key, 0) + 1
+        if count == 1 or count % _ERROR_LOG_EVERY == 0:
+            _LOGGER.exception(msg, *args)
+        else:
+            _LOGGER.debug(msg, *args)
+
+    @cached_property
+    def _entity_ids(self) -> Mapping[str, str]:
+        """Entity ids of the tracked helpers, built once per dog."""
+        dog_name = self.dog_name
+        return MappingProxyType(
+            {key: f"{platform}.{dog_name}_{key}" for key, platform in _TRACKED_ENTITIES}
+        )
+
+    def _snapshot_states(self) -> dict[str, State | None]:
+        """Read every tracked helper state once, keyed by entity suffix."""
+        get_state = self.hass.states.get
+        return {
+            key: get_state(entity_id) for key, entity_id in self._entity_ids.items()
+        }
+
+    def _parse_number(
+        self,
+        state: State | None,
+        cast: type[int | float],
+        default: int | float | None,
+    ) -> int | float | None:
+        """Parse a numeric helper state, reusing the value while it is unchanged.
+
+        Missing helpers and non-numeric states such as ``unknown`` yield
+        ``default`` (the previous good value) instead of failing the section.
+        """
+        if state is None:
+            return default
+        raw = state.state
+        cached = self._num_cache.get(state.entity_id)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
         try:
-            morning_state = self.hass.states.get(
-                f"input_boolean.{self.dog_name}_feeding_morning"
-            )
-            evening_state = self.hass.states.get(
-                f"input_boolean.{self.dog_name}_feeding_evening"
-            )
-            last_feeding_state = self.hass.states.get(
-                f"input_datetime.{self.dog_name}_last_feeding"
-            )
+            value = cast(raw)
+        except (TypeError, ValueError):
+            _LOGGER.debug("Non-numeric state %r for %s", raw, state.entity_id)
+            value = default
+        self._num_cache[state.entity_id] = (raw, value)
+        return value
 
-            morning_fed = morning_state.state == "on" if morning_state else False
-            evening_fed = evening_state.state == "on" if evening_state else False
-
-            return {
-                "morning_fed": morning_fed,
-                "evening_fed": evening_fed,
-                "last_feeding": last_feeding_state.state
-                if last_feeding_state
-                else None,
-                # Needs feeding if either the morning or evening feeding has not been completed
-                "needs_feeding": not (morning_fed and evening_fed),
-            }
-        except Exception as e:
-            _LOGGER.exception("Error getting feeding status: %s", e)
-            return {}
+    def _previous(self, section: str) -> Mapping[str, Any]:
+        """Return a section of the last good data set for missing helpers."""
+        return (self.data or _EMPTY).get(section) or _EMPTY
+
+    def _get_feeding_status(self, states: Mapping[str, State | None]) -> dict[str, Any]:
+        """Get feeding status."""
+        prev = self._previous("feeding_status")
+        morning_state = states["feeding_morning"]
+        evening_state = states["feeding_evening"]
+        last_feeding_state = states["last_feeding"]
+
+        morning_fed = (
+            _is_on(morning_state) if morning_state else prev.get("morning_fed", False)
+        )
+        evening_fed = (
+            _is_on(evening_state) if evening_state else prev.get("evening_fed", False)
+        )
 
-    async def _get_activity_status(self) -> dict[str, Any]:
+        return {
+            "morning_fed": morning_fed,
+            "evening_fed": evening_fed,
+            "last_feeding": last_feeding_state.state
+            if last_feeding_state
+            else prev.get("last_feeding"),
+            # Needs feeding if either the morning or evening feeding has not
+            # been completed
+            "needs_feeding": not (morning_fed and evening_fed),
+        }
+
+    def _get_activity_status(
+        self, states: Mapping[str, State | None]
+    ) -> dict[str, Any]:
         """Get activity status."""
-        try:
-            outside_state = self.hass.states.get(
-                f"input_boolean.{self.dog_name}_outside"
-            )
-            walked_state = self.hass.states.get(
-                f"input_boolean.{self.dog_name}_walked_today"
-            )
-            poop_state = self.hass.states.get(
-                f"input_boolean.{self.dog_name}_poop_done"
-            )
-            last_walk_state = self.hass.states.get(
-                f"input_datetime.{self.dog_name}_last_walk"
-            )
-            walk_count_state = self.hass.states.get(
-                f"counter.{self.dog_name}_walk_count"
-            )
+        prev = self._previous("activity_status")
+        outside_state = states["outside"]
+        walked_state = states["walked_today"]
+        poop_state = states["poop_done"]
+        last_walk_state = states["last_walk"]
 
-            return {
-                "was_outside": outside_state.state == "on" if outside_state else False,
-                "walked_today": walked_state.state == "on" if walked_state else False,
-                "poop_done": poop_state.state == "on" if poop_state else False,
-                "last_walk": last_walk_state.state if last_walk_state else None,
-                "walk_count": int(walk_count_state.state) if walk_count_state else 0,
-                "needs_walk": not (walked_state and walked_state.state == "on"),
-            }
-        except Exception as e:
-            _LOGGER.exception("Error getting activity status: %s", e)
-            return {}
+        walked_today = (
+            _is_on(walked_state) if walked_state else prev.get("walked_today", False)
+        )
 
-    async def _get_health_status(self) -> dict[str, Any]:
+        return {
+            "was_outside": _is_on(outside_state)
+            if outside_state
+            else prev.get("was_outside", False),
+            "walked_today": walked_today,
+            "poop_done": _is_on(poop_state)
+            if poop_state
+            else prev.get("poop_done", False),
+            "last_walk": last_walk_state.state
+            if last_walk_state
+            else prev.get("last_walk"),
+            "walk_count": self._parse_number(
+                states["walk_count"], int, prev.get("walk_count", 0)
+            ),
+            "needs_walk": not walked_today,
+        }
+
+    def _get_health_status(self, states: Mapping[str, State | None]) -> dict[str, Any]:
         """Get health status."""
-        try:
-            weight_state = self.hass.states.get(f"input_number.{self.dog_name}_weight")
-            health_notes_state = self.hass.states.get(
-                f"input_text.{self.dog_name}_health_notes"
-            )
+        prev = self._previous("health_status")
+        health_notes_state = states["health_notes"]
 
-            return {
-                "weight": float(weight_state.state) if weight_state else None,
-                "health_notes": health_notes_state.state if health_notes_state else "",
-                "status": "good",  # Simplified status
-            }
-        except Exception as e:
-            _LOGGER.exception("Error getting health status: %s", e)
-            return {}
+        return {
+            "weight": self._parse_number(states["weight"], float, prev.get("weight")),
+            "health_notes": health_notes_state.state
+            if health_notes_state
+            else prev.get("health_notes", ""),
+            "status": "good",  # Simplified status
+        }
 
-    async def _get_location_status(self) -> dict[str, Any]:
+    def _get_location_status(
+        self, states: Mapping[str, State | None]
+    ) -> dict[str, Any]:
         """Get location status."""
-        try:
-            location_state = self.hass.states.get(
-                f"input_text.{self.dog_name}_current_location"
-            )
-            signal_state = self.hass.states.get(
-                f"input_number.{self.dog_name}_gps_signal_strength"
-            )
+        prev = self._previous("location_status")
+        location_state = states["current_location"]
 
-            return {
-                "current_location": location_state.state
-                if location_state
-                else "Unknown",
-                "gps_signal": float(signal_state.state) if signal_state else 0,
-                "gps_available": bool(location_state and location_state.state),
-            }
-        except Exception as e:
-            _LOGGER.exception("Error getting location status: %s", e)
-            return {}
+        return {
+            "current_location": location_state.state
+            if location_state
+            else prev.get("current_location", "Unknown"),
+            "gps_signal": self._parse_number(
+                states["gps_signal_strength"], float, prev.get("gps_signal", 0)
+            ),
+            "gps_available": bool(location_state.state)
+            if location_state
+            else prev.get("gps_available", False),
+        }
 
-    def _calculate_happiness(self, data: dict[str, Any]) -> str:
+    def _calculate_happiness(self, data: Mapping[str, Any]) -> str:
         """Simple happiness metric based on feeding and walk status."""
-        feeding = data.get("feeding_status", {})
-        activity = data.get("activity_status", {})
-        fed = feeding.get("morning_fed", False) and feeding.get("evening_fed", False)
-        walked = activity.get("walked_today", False)
+        feeding = data.get("feeding_status") or _EMPTY
+        activity = data.get("activity_status") or _EMPTY
+        fed = bool(feeding.get("morning_fed") and feeding.get("evening_fed"))
+        walked = bool(activity.get("walked_today"))
 
-        if fed and walked:
-            return "Happy"
-        return "Needs attention"
+        return _HAPPINESS[fed << 1 | walked]
 
     def get_status_summary(self) -> str:
-        """Get a simple status summary."""
-        if not self.data:
+        """Get a simple status summary, computed once per data update."""
+        summary = self._summary_cache
+        if summary is None:
+            summary = self._summary_cache = self._compute_status_summary()
+        return summary
+
+    def _compute_status_summary(self) -> str:
+        """Build the status summary from the current data."""
+        data = self.data
+        if not data:
             return "⏳ Initialisierung..."
 
         try:
-            feeding = self.data.get("feeding_status", {})
-            activity = self.data.get("activity_status", {})
+            feeding = data.get("feeding_status") or _EMPTY
+            activity = data.get("activity_status") or _EMPTY
 
-            fed = feeding.get("morning_fed", False) and feeding.get(
-                "evening_fed", False
-            )
-            walked = activity.get("walked_today", False)
-            outside = activity.get("was_outside", False)
-
-            if fed and walked and outside:
-                return "✅ Alles erledigt"
-            if fed and (walked or outside):
-                return "📝 Teilweise erledigt"
-            if not fed and not walked:
-                return "⏰ Fütterung & Spaziergang ausstehend"
-            if not fed:
-                return "🍽️ Fütterung ausstehend"
-            if not walked:
-                return "🚶 Spaziergang ausstehend"
-            return "👍 Gut"
-
-        except Exception as e:
-            _LOGGER.exception("Error getting status summary: %s", e)
+            fed = bool(feeding.get("morning_fed") and feeding.get("evening_fed"))
+            walked = bool(activity.get("walked_today"))
+            outside = bool(activity.get("was_outside"))
+
+            return _STATUS_SUMMARIES[fed << 2 | walked << 1 | outside]
+
+        except (AttributeError, TypeError) as e:
+            self._log_error("summary", "Error getting status summary: %s", e)
             return "❓ Unbekannt"
@@ -3,70 +3,80 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.util import slugify
+
+from .const import DOMAIN
 from .utils import generate_entity_id
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def create_dashboard(hass: HomeAssistant, dog_name: str) -> None:
-    """Create a Lovelace dashboard definition and store it in a sensor."""
-
-    dog_slug_health = generate_entity_id(dog_name, "sensor", "health")
-    dog_slug_last_walk = generate_entity_id(dog_name, "sensor", "last_walk")
-    dog_slug_gps_location = generate_entity_id(dog_name, "sensor", "gps_location")
-    dog_slug_walks = generate_entity_id(dog_name, "counter", "walks")
-    dog_slug_walk_active = generate_entity_id(dog_name, "input_boolean", "walk_active")
-    dog_slug_gps_active = generate_entity_id(dog_name, "input_boolean", "gps_active")
-    dog_slug_push_active = generate_entity_id(dog_name, "input_boolean", "push_active")
-    dog_slug_symptoms = generate_entity_id(dog_name, "input_text", "symptoms")
-    dog_slug_medication = generate_entity_id(dog_name, "input_text", "medication")
-    dog_slug_weight = generate_entity_id(dog_name, "input_number", "weight")
-
-    dashboard_yaml = f"""
+# Lovelace YAML for one dog, filled in with ``str.format_map`` in a single pass
+_DASHBOARD_TEMPLATE = """
 title: 🐾 Paw Control: {dog_name}
 views:
   - title: Übersicht
     cards:
       - type: custom:mushroom-entity-card
-        entity: {dog_slug_health}
+        entity: sensor.{dog_slug}_health
         name: Gesundheit
       - type: custom:mushroom-entity-card
-        entity: {dog_slug_last_walk}
+        entity: sensor.{dog_slug}_last_walk
         name: Letztes Gassi
       - type: custom:mushroom-entity-card
-        entity: {dog_slug_gps_location}
+        entity: sensor.{dog_slug}_gps_location
         name: GPS-Position
       - type: custom:mushroom-entity-card
-        entity: {dog_slug_walks}
+        entity: counter.{dog_slug}_walks
         name: Spaziergänge gesamt
       - type: custom:mushroom-entity-card
-        entity: {dog_slug_walk_active}
+        entity: input_boolean.{dog_slug}_walk_active
         name: Gerade Gassi?
       - type: custom:mushroom-entity-card
-        entity: {dog_slug_gps_active}
+        entity: input_boolean.{dog_slug}_gps_active
         name: GPS aktiv?
       - type: custom:mushroom-entity-card
-        entity: {dog_slug_push_active}
+        entity: input_boolean.{dog_slug}_push_active
         name: Push aktiviert?
       - type: custom:mushroom-entity-card
-        entity: {dog_slug_symptoms}
+        entity: input_text.{dog_slug}_symptoms
         name: Symptome
       - type: custom:mushroom-entity-card
-        entity: {dog_slug_medication}
+        entity: input_text.{dog_slug}_medication
         name: Medikamente
       - type: custom:mushroom-entity-card
-        entity: {dog_slug_weight}
+        entity: input_number.{dog_slug}_weight
         name: Gewicht (kg)
     """
 
+
+@lru_cache(maxsize=32)
+def _build_dashboard_yaml(dog_name: str) -> str:
+    """Render the Lovelace YAML for one dog; pure, so it is built once per name."""
+    return _DASHBOARD_TEMPLATE.format_map(
+        {"dog_name": dog_name, "dog_slug": slugify(dog_name)}
+    )
+
+
+async def create_dashboard(hass: HomeAssistant, dog_name: str) -> None:
+    """Create a Lovelace dashboard definition and store it in a sensor."""
+    dashboard_yaml = _build_dashboard_yaml(dog_name)
+
     # Store the YAML definition in a sensor for the user to copy into Lovelace
     dashboard_sensor_id = generate_entity_id(dog_name, "sensor", "dashboard_yaml")
+    current = hass.states.get(dashboard_sensor_id)
+    if current is not None and current.state == dashboard_yaml:
+        return
     hass.states.async_set(
         dashboard_sensor_id,
         dashboard_yaml,
@@ -76,26 +86,38 @@ views:
 
 DEFAULT_DASHBOARD_NAME = "PawControl"
 
-MODULE_CARDS = {
-    "gps": {
-        "type": "map",
-        "entities": ["device_tracker.paw_control_gps"],
-        "title": "GPS-Tracking",
-    },
-    "health": {
-        "type": "entities",
-        "entities": [
-            "sensor.paw_control_health_status",
-            "sensor.paw_control_last_checkup",
-        ],
-        "title": "Gesundheit",
-    },
-    "walk": {
-        "type": "history-graph",
-        "entities": ["sensor.paw_control_last_walk", "sensor.paw_control_walk_count"],
-        "title": "Gassi",
-    },
-}
+# Read-only card templates; views receive a plain ``dict`` copy of each card
+MODULE_CARDS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "gps": MappingProxyType(
+            {
+                "type": "map",
+                "entities": (f"device_tracker.{DOMAIN}_gps",),
+                "title": "GPS-Tracking",
+            }
+        ),
+        "health": MappingProxyType(
+            {
+                "type": "entities",
+                "entities": (
+                    f"sensor.{DOMAIN}_health_status",
+                    f"sensor.{DOMAIN}_last_checkup",
+                ),
+                "title": "Gesundheit",
+            }
+        ),
+        "walk": MappingProxyType(
+            {
+                "type": "history-graph",
+                "entities": (
+                    f"sensor.{DOMAIN}_last_walk",
+                    f"sensor.{DOMAIN}_walk_count",
+                ),
+                "title": "Gassi",
+            }
+        ),
+    }
+)
 
 
 async def async_create_dashboard(hass: HomeAssistant, entry: ConfigEntry):
@@ -104,7 +126,7 @@ async def async_create_dashboard(hass: HomeAssistant, entry: ConfigEntry):
     for module in modules:
         card = MODULE_CARDS.get(module)
         if card:
-            cards.append(card)
+            cards.append(dict(card))
     if not cards:
         _LOGGER.warning("No module cards selected for dashboard generation.")
         return None
@@ -114,7 +136,7 @@ async def async_create_dashboard(hass: HomeAssistant, entry: ConfigEntry):
         "icon": "mdi:paw",
         "cards": cards,
     }
-    _LOGGER.info(f"Generated PawControl dashboard: {view}")
+    _LOGGER.info("Generated PawControl dashboard: %s", view)
     return view
 
 
@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from .const import DOMAIN
+from .const import DOMAIN, Icon
 from .entities import PawControlDateTimeEntity
-from .helpers.entity import get_icon
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -19,7 +18,8 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-DATETIME_ENTITIES: list[dict] = [
+# Per-entity keyword arguments; the icon falls back to ``ICONS[key]``
+DATETIME_ENTITIES: tuple[dict[str, Any], ...] = (
     {"key": "last_feeding_morning"},
     {"key": "last_feeding_lunch"},
     {"key": "last_feeding_evening"},
@@ -27,20 +27,20 @@ DATETIME_ENTITIES: list[dict] = [
     {"key": "feeding_morning_time", "has_date": False},
     {"key": "feeding_lunch_time", "has_date": False},
     {"key": "feeding_evening_time", "has_date": False},
-    {"key": "last_walk", "icon": get_icon("walk")},
+    {"key": "last_walk", "icon": Icon.WALK},
     {"key": "last_outside"},
     {"key": "last_play"},
-    {"key": "last_training", "icon": get_icon("training")},
-    {"key": "last_grooming", "icon": get_icon("grooming")},
+    {"key": "last_training", "icon": Icon.TRAINING},
+    {"key": "last_grooming", "icon": Icon.GROOMING},
     {"key": "last_activity"},
-    {"key": "last_vet_visit", "icon": get_icon("vet")},
-    {"key": "next_vet_appointment", "icon": get_icon("vet")},
-    {"key": "last_medication", "icon": get_icon("medication")},
-    {"key": "last_weight_check", "icon": get_icon("weight")},
+    {"key": "last_vet_visit", "icon": Icon.VET},
+    {"key": "next_vet_appointment", "icon": Icon.VET},
+    {"key": "last_medication", "icon": Icon.MEDICATION},
+    {"key": "last_weight_check", "icon": Icon.WEIGHT},
     {"key": "visitor_start"},
     {"key": "visitor_end"},
-    {"key": "emergency_contact_time", "icon": get_icon("emergency")},
-]
+    {"key": "emergency_contact_time", "icon": Icon.EMERGENCY},
+)
 
 
 async def async_setup_entry(
@@ -54,9 +54,10 @@ async def async_setup_entry(
     ]
     dog_name = coordinator.dog_name
 
-    entities = [
-        PawControlDateTimeEntity(coordinator, dog_name=dog_name, **cfg)
-        for cfg in DATETIME_ENTITIES
-    ]
-
-    async_add_entities(entities)
+    async_add_entities(
+        (
+            PawControlDateTimeEntity(coordinator, dog_name=dog_name, **cfg)
+            for cfg in DATETIME_ENTITIES
+        ),
+        update_before_add=False,
+    )
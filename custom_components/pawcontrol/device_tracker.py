@@ -6,11 +6,11 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.components.device_tracker import SourceType
+from homeassistant.core import callback
 
-from .const import DOMAIN
+from .const import DOMAIN, Icon
 from .entities import PawControlDeviceTrackerEntity
 from .gps_handler import PawControlGPSHandler
-from .helpers.entity import get_icon
 from .helpers.gps import is_valid_gps_coords
 
 if TYPE_CHECKING:
@@ -49,6 +49,8 @@ async def async_setup_entry(
 class PawControlDeviceTracker(PawControlDeviceTrackerEntity):
     """GPS device tracker for the dog."""
 
+    __slots__ = ("_gps_handler",)
+
     def __init__(
         self,
         coordinator: PawControlCoordinator,
@@ -56,11 +58,18 @@ class PawControlDeviceTracker(PawControlDeviceTrackerEntity):
         gps_handler: PawControlGPSHandler,
     ) -> None:
         super().__init__(
-            coordinator, dog_name=dog_name, key="device_tracker", icon=get_icon("gps")
+            coordinator, dog_name=dog_name, key="device_tracker", icon=Icon.GPS
         )
         self._gps_handler = gps_handler
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Snapshot the handler position once per coordinator update."""
+        self._update_state()
+        super()._handle_coordinator_update()
+
     def _update_state(self) -> None:
+        """Read the handler location once; the properties serve this snapshot."""
         location = self._gps_handler.get_current_location()
         if location and is_valid_gps_coords(location[0], location[1]):
             self._state = {"lat": location[0], "lon": location[1]}
@@ -2,21 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from pawcontrol.const import DOMAIN
-from pawcontrol.helpers.entity import build_attributes, format_name, get_icon
+from pawcontrol.const import ATTR_DOG_NAME, ATTR_LAST_UPDATED, DOMAIN
+from pawcontrol.helpers.entity import format_name, get_icon
+from pawcontrol.helpers.json import ensure_json_mapping
 from pawcontrol.utils import safe_service_call
 
 if TYPE_CHECKING:
     from pawcontrol.helpers.json import JSONMutableMapping
 
+# Laufende Refresh-Anfrage je Coordinator; gleichzeitige Updates teilen sie sich
+_pending_refreshes: WeakKeyDictionary[Any, asyncio.Task[None]] = WeakKeyDictionary()
+
 
 class PawControlBaseEntity(CoordinatorEntity):
     """Gemeinsame Funktionalität für alle Entities der Integration."""
 
+    # Home Assistants Entity-Basisklassen behalten ihr ``__dict__``; die
+    # eigenen Felder liegen in Slots
+    __slots__ = (
+        "_base_attributes",
+        "_data_key",
+        "_dog_name",
+        "_seen_version",
+        "_state",
+    )
+
     def __init__(
         self,
         coordinator,
@@ -34,14 +52,35 @@ class PawControlBaseEntity(CoordinatorEntity):
             unique_suffix = key
 
         super().__init__(coordinator)
-        self._attr_name = name
+        # Name und Unique-ID werden laufend als Dict-Schlüssel verglichen
+        # (Coordinator-Daten, Entity-Registry) und deshalb interniert
+        self._attr_name = sys.intern(name) if name else name
+        # Fester Schlüssel in den Coordinator-Daten, unabhängig vom Anzeigenamen
+        self._data_key = self._attr_name
+        # Zuletzt übernommene ``data_version`` des Coordinators
+        self._seen_version: int | None = None
         self._dog_name = dog_name
         self._state = None
 
         if dog_name and unique_suffix:
-            self._attr_unique_id = f"{DOMAIN}_{dog_name.lower()}_{unique_suffix}"
+            self._attr_unique_id = sys.intern(
+                f"{DOMAIN}_{dog_name.lower()}_{unique_suffix}"
+            )
         if icon or key:
             self._attr_icon = icon or get_icon(key)
+        # Konstante Attribute; pro Zugriff kommt nur der Update-Zeitpunkt hinzu
+        self._base_attributes: JSONMutableMapping = (
+            {ATTR_DOG_NAME: dog_name} if dog_name else {}
+        )
+        # Geräteinformationen einmalig aufbauen statt bei jedem Registry-Zugriff
+        if dog_name:
+            self._attr_device_info = {
+                "identifiers": {(DOMAIN, dog_name.lower())},
+                "name": f"Paw Control - {dog_name}",
+                "manufacturer": "Paw Control",
+                "model": "Dog Management System",
+                "sw_version": "1.0.0",
+            }
 
     @property
     def available(self) -> bool:
@@ -49,37 +88,72 @@ class PawControlBaseEntity(CoordinatorEntity):
         return getattr(self.coordinator, "last_update_success", True)
 
     async def async_update(self) -> None:
-        """Standard-Update via Coordinator."""
-        await self.coordinator.async_request_refresh()
+        """Standard-Update via Coordinator.
+
+        ``async_refresh`` läuft sofort statt über den Debouncer, damit
+        ``_update_state`` die neuen Daten liest; gleichzeitige Updates teilen
+        sich einen Lauf.
+        """
+        coordinator = self.coordinator
+        pending = _pending_refreshes.get(coordinator)
+        if pending is None or pending.done():
+            pending = self.hass.async_create_task(coordinator.async_refresh())
+            _pending_refreshes[coordinator] = pending
+        # Abgeschirmt: ein abgebrochenes Update bricht nicht den geteilten Refresh
+        await asyncio.shield(pending)
         self._update_state()
 
     def _update_state(self) -> None:
         """Setzt ``self._state``. Kann in Unterklassen überschrieben werden."""
-        self._state = self.coordinator.data.get(self._attr_name)
-
-    @property
-    def device_info(self) -> dict | None:
-        """Gebe Geräteinformationen zurück, falls ein Hund gesetzt wurde."""
-        if not self._dog_name:
-            return None
-        return {
-            "identifiers": {(DOMAIN, self._dog_name.lower())},
-            "name": f"Paw Control - {self._dog_name}",
-            "manufacturer": "Paw Control",
-            "model": "Dog Management System",
-            "sw_version": "1.0.0",
-        }
+        if not self._data_changed():
+            return
+        self._state = self.coordinator.data.get(self._data_key)
+
+    def _publish_state(self) -> None:
+        """Schreibt den lokal gesetzten Wert optimistisch in den Coordinator.
+
+        Abonnenten sehen den Wert sofort, ohne auf den nächsten Refresh zu
+        warten; die übrigen Einträge bleiben unverändert.
+        """
+        data = self.coordinator.data
+        if data is None or self._data_key is None:
+            return
+        self.coordinator.async_set_updated_data({**data, self._data_key: self._state})
+
+    def _data_changed(self) -> bool:
+        """Prüft, ob der Coordinator seit dem letzten Lesen neue Daten hat.
+
+        Coordinators ohne ``data_version`` gelten immer als geändert.
+        """
+        version = getattr(self.coordinator, "data_version", None)
+        if version is not None and version == self._seen_version:
+            return False
+        self._seen_version = version
+        return True
 
     @property
     def extra_state_attributes(self) -> JSONMutableMapping:
         """Zusätzliche Attribute für den Entity-State."""
         if not self._dog_name:
             return {}
-        return self.build_extra_attributes()
+        return {ATTR_LAST_UPDATED: self._last_updated(), **self._base_attributes}
 
     def build_extra_attributes(self, **extra: Any) -> JSONMutableMapping:
         """Hilfsfunktion für Unterklassen zur Attribut-Erstellung."""
-        return build_attributes(self._dog_name, **extra)
+        attrs = {ATTR_LAST_UPDATED: self._last_updated(), **self._base_attributes}
+        attrs.update(ensure_json_mapping(extra))
+        return attrs
+
+    def _last_updated(self) -> str | None:
+        """Zeitpunkt des letzten Coordinator-Neuaufbaus statt der Lesezeit.
+
+        So bleiben die Attribute zwischen zwei Updates unverändert und Home
+        Assistant muss sie nicht bei jedem Schreiben neu serialisieren.
+        """
+        last_updated = (self.coordinator.data or {}).get(ATTR_LAST_UPDATED)
+        if isinstance(last_updated, datetime):
+            return last_updated.isoformat()
+        return last_updated
 
     async def _safe_service_call(self, domain: str, service: str, data: dict) -> bool:
         """Hilfsfunktion für sichere Serviceaufrufe."""
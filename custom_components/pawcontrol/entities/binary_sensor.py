@@ -9,6 +9,8 @@ from .base import PawControlBaseEntity
 class PawControlBinarySensorEntity(PawControlBaseEntity, BinarySensorEntity):
     """Basisklasse für Binary Sensor-Entities mit Konvertierung."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator,
@@ -33,8 +35,8 @@ class PawControlBinarySensorEntity(PawControlBaseEntity, BinarySensorEntity):
 
     def _update_state(self) -> None:
         """Hole und konvertiere den Status aus den Koordinatordaten."""
-        self._state = as_bool(self.coordinator.data.get(self._attr_name))
-
-    @property
-    def is_on(self) -> bool:
-        return self._state
+        if not self._data_changed():
+            return
+        self._attr_is_on = self._state = as_bool(
+            self.coordinator.data.get(self._data_key)
+        )
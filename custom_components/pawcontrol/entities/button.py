@@ -11,6 +11,8 @@ from .base import PawControlBaseEntity
 class PawControlButtonEntity(PawControlBaseEntity, ButtonEntity):
     """Basisklasse für Button-Entities mit Namens- und Icon-Handling."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator,
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.components.datetime import DateTimeEntity
 
 from pawcontrol.helpers.entity import parse_datetime
 
 from .base import PawControlBaseEntity
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
 
 class PawControlDateTimeEntity(PawControlBaseEntity, DateTimeEntity):
     """Gemeinsame Funktionalität für DateTime-Entities."""
 
+    __slots__ = ("_cached_dt", "_cached_raw")
+
     def __init__(
         self,
         coordinator,
@@ -34,7 +41,15 @@ class PawControlDateTimeEntity(PawControlBaseEntity, DateTimeEntity):
         )
         self._attr_has_date = has_date
         self._attr_has_time = has_time
+        # Zuletzt geparster Rohzustand und sein Ergebnis
+        self._cached_raw: str | None = None
+        self._cached_dt: datetime | None = None
 
     @property
-    def native_value(self):
-        return parse_datetime(self._state)
+    def native_value(self) -> datetime | None:
+        """Zeitpunkt des Zustands; unveränderte Werte werden nicht neu geparst."""
+        raw = self._state
+        if raw != self._cached_raw:
+            self._cached_dt = parse_datetime(raw)
+            self._cached_raw = raw
+        return self._cached_dt
@@ -10,6 +10,8 @@ from .base import PawControlBaseEntity
 class PawControlDeviceTrackerEntity(PawControlBaseEntity, TrackerEntity):
     """Basisklasse für Device Tracker-Entities mit Koordinatenvalidierung."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator,
@@ -31,7 +33,9 @@ class PawControlDeviceTrackerEntity(PawControlBaseEntity, TrackerEntity):
 
     def _update_state(self) -> None:
         """Aktualisiere den internen GPS-Status."""
-        data = self.coordinator.data.get(self._attr_name, {})
+        if not self._data_changed():
+            return
+        data = self.coordinator.data.get(self._data_key, {})
         lat = data.get("lat")
         lon = data.get("lon")
         if is_valid_gps_coords(lat, lon):
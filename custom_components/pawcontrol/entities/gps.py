@@ -9,6 +9,8 @@ from .base import PawControlBaseEntity
 class PawControlGpsEntity(PawControlBaseEntity):
     """Basisklasse für GPS-Entities mit gemeinsamer Update-Logik."""
 
+    __slots__ = ()
+
     def __init__(self, coordinator, name):
         """Initialisiere die GPS-Entity."""
         super().__init__(coordinator, name)
@@ -16,12 +18,17 @@ class PawControlGpsEntity(PawControlBaseEntity):
     @property
     def available(self):
         """Entity ist verfügbar, wenn Koordinaten gültig sind."""
-        data = self.coordinator.data.get(self._attr_name, {})
+        # Ohne erfolgreiches Coordinator-Update erübrigt sich die Prüfung
+        if not super().available:
+            return False
+        data = self.coordinator.data.get(self._data_key, {})
         return is_valid_gps_coords(data.get("lat"), data.get("lon"))
 
     def _update_state(self):
         """Aktualisiere internen State mit gültigen Koordinaten."""
-        data = self.coordinator.data.get(self._attr_name, {})
+        if not self._data_changed():
+            return
+        data = self.coordinator.data.get(self._data_key, {})
         if is_valid_gps_coords(data.get("lat"), data.get("lon")):
             self._state = (data["lat"], data["lon"])
         else:
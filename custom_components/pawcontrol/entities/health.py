@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 class PawControlHealthEntity(Entity):
     """Basisklasse für Health-Überwachungs-Entities."""
 
+    __slots__ = ("_activity_logger", "_dog_name")
+
     def __init__(
         self,
         activity_logger,
@@ -9,6 +9,8 @@ from .base import PawControlBaseEntity
 class PawControlNumberEntity(PawControlBaseEntity, NumberEntity):
     """Basisklasse für Number-Entities mit Validierung."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator,
@@ -47,10 +49,14 @@ class PawControlNumberEntity(PawControlBaseEntity, NumberEntity):
         if state_class:
             self._attr_state_class = state_class
 
-    @property
-    def native_value(self):
-        return self._state
+    def _update_state(self) -> None:
+        """Übernimmt den Koordinatorwert als Entity-Wert."""
+        super()._update_state()
+        self._attr_native_value = self._state
 
     async def async_set_native_value(self, value: float) -> None:
         """Setze den numerischen Wert innerhalb der Grenzen."""
-        self._state = clamp_value(value, self.native_min_value, self.native_max_value)
+        self._attr_native_value = self._state = clamp_value(
+            value, self._attr_native_min_value, self._attr_native_max_value
+        )
+        self._publish_state()
@@ -1,6 +1,7 @@
 # entities/select.py
 from homeassistant.components.select import SelectEntity
 
+from pawcontrol.const import get_option_set
 from pawcontrol.helpers.entity import ensure_option
 
 from .base import PawControlBaseEntity
@@ -9,6 +10,8 @@ from .base import PawControlBaseEntity
 class PawControlSelectEntity(PawControlBaseEntity, SelectEntity):
     """Basisklasse für Select-Entities mit Validierung."""
 
+    __slots__ = ("_option_set",)
+
     def __init__(
         self,
         coordinator,
@@ -18,7 +21,7 @@ class PawControlSelectEntity(PawControlBaseEntity, SelectEntity):
         *,
         key: str | None = None,
         icon: str | None = None,
-        options: list[str] | None = None,
+        options: tuple[str, ...] | list[str] | None = None,
     ) -> None:
         super().__init__(
             coordinator,
@@ -29,16 +32,21 @@ class PawControlSelectEntity(PawControlBaseEntity, SelectEntity):
             icon=icon,
         )
         self._attr_options = options or []
+        self._option_set = get_option_set(self._attr_options)
         if self._attr_options:
-            self._state = self._attr_options[0]
+            self._attr_current_option = self._state = self._attr_options[0]
 
-    @property
-    def current_option(self):
-        return self._state
+    def _update_state(self) -> None:
+        """Übernimmt den Koordinatorwert als Entity-Wert."""
+        super()._update_state()
+        self._attr_current_option = self._state
 
     async def async_select_option(self, option: str):
         """Wähle eine Option aus der Optionsliste."""
-        self._state = ensure_option(option, self.options)
+        if option not in self._option_set:
+            option = ensure_option(option, self.options)
+        self._attr_current_option = self._state = option
+        self._publish_state()
 
     @property
     def options(self):
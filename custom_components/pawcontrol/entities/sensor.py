@@ -4,6 +4,8 @@ from .base import PawControlBaseEntity
 class PawControlSensorEntity(PawControlBaseEntity):
     """Basisklasse für alle Sensoren mit gemeinsamer Initialisierung."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator,
@@ -31,7 +33,9 @@ class PawControlSensorEntity(PawControlBaseEntity):
 
     def _update_state(self):
         """Holt den State aus den Koordinatordaten."""
-        self._state = self.coordinator.data.get(self._attr_name)
+        if not self._data_changed():
+            return
+        self._state = self.coordinator.data.get(self._data_key)
 
     @property
     def state(self):
@@ -9,6 +9,8 @@ from .base import PawControlBaseEntity
 class PawControlSwitchEntity(PawControlBaseEntity, SwitchEntity):
     """Basisklasse für Switch-Entities mit boolescher Konvertierung."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator,
@@ -30,11 +32,11 @@ class PawControlSwitchEntity(PawControlBaseEntity, SwitchEntity):
 
     def _update_state(self) -> None:
         """Hole und konvertiere den Status aus den Koordinatordaten."""
-        self._state = as_bool(self.coordinator.data.get(self._attr_name))
-
-    @property
-    def is_on(self) -> bool:
-        return self._state
+        if not self._data_changed():
+            return
+        self._attr_is_on = self._state = as_bool(
+            self.coordinator.data.get(self._data_key)
+        )
 
     async def async_turn_on(self, **kwargs):
         # Geräte einschalten
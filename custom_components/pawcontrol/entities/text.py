@@ -12,6 +12,8 @@ from .base import PawControlBaseEntity
 class PawControlTextEntity(PawControlBaseEntity, TextEntity):
     """Gemeinsame Funktionalität für Text-Entities."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator,
@@ -35,10 +37,12 @@ class PawControlTextEntity(PawControlBaseEntity, TextEntity):
         self._attr_native_max = max_length
         self._attr_mode = mode
 
-    @property
-    def native_value(self) -> str | None:
-        return self._state
+    def _update_state(self) -> None:
+        """Übernimmt den Koordinatorwert als Entity-Wert."""
+        super()._update_state()
+        self._attr_native_value = self._state
 
     async def async_set_value(self, value: str) -> None:
         """Setze den Textwert mit Längenbegrenzung."""
-        self._state = clamp_string(value, self.native_max)
+        self._attr_native_value = self._state = clamp_string(value, self.native_max)
+        self._publish_state()
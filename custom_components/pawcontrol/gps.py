@@ -1,6 +1,6 @@
 """GPS-Modul für Paw Control – Verwaltung, Helper, Setup/Teardown."""
 
-from .const import *
+from .const import CONF_DOG_NAME, DEFAULT_GPS_LOCATION
 from .utils import call_service
 
 
@@ -377,8 +377,9 @@ class PawControlDataUpdateCoordinator(DataUpdateCoordinator):
                     return
 
             # Calculate distance from home
+            home_coordinates = self._home_coordinates
             distance_from_home = calculate_distance(
-                (latitude, longitude), self._home_coordinates
+                (latitude, longitude), home_coordinates
             )
 
             # Check if walk should auto-start (> 50m from home)
@@ -403,10 +404,13 @@ class PawControlDataUpdateCoordinator(DataUpdateCoordinator):
             elif distance_from_home < 20 and await self._is_walk_in_progress():
                 # Simple auto-end after being close to home
                 await asyncio.sleep(30)  # Wait 30 seconds
-                current_distance = calculate_distance(
-                    (latitude, longitude), self._home_coordinates
-                )
-                if current_distance < 20:  # Still close to home
+                # The position is unchanged, so only a moved home needs a new
+                # haversine; otherwise reuse the distance computed above
+                if self._home_coordinates != home_coordinates:
+                    distance_from_home = calculate_distance(
+                        (latitude, longitude), self._home_coordinates
+                    )
+                if distance_from_home < 20:  # Still close to home
                     await self.async_end_walk_tracking(
                         {
                             "walk_rating": 5,
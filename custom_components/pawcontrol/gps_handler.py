@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -14,15 +15,14 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.util.dt import now
 
-from .const import (
-    DEFAULT_HOME_COORDINATES,
-    GPS_CONFIG,
-)
+from .const import DEFAULT_HOME_COORDINATES, GPS
 from .exceptions import GPSError, InvalidCoordinates
 from .utils import (
     calculate_distance,
     calculate_speed_kmh,
+    distance_from_center,
     format_coordinates,
+    is_within_radius,
     safe_service_call,
     validate_coordinates,
 )
@@ -49,6 +49,8 @@ class PawControlGPSHandler:
         self._previous_location: tuple[float, float] | None = None
         self._home_location: tuple[float, float] | None = None
         self._last_update: datetime | None = None
+        # Monotonic twin of ``_last_update`` for cheap staleness checks
+        self._last_update_monotonic: float | None = None
         self._accuracy: float = 0.0
         self._speed: float = 0.0
 
@@ -149,7 +151,11 @@ class PawControlGPSHandler:
             "calories_burned": self._calories_burned,
             "geofences": self._geofences,
             "last_geofence_status": self._last_geofence_status,
-            "movement_history": self._movement_history,
+            # Summarised: the full history keeps up to 100 points
+            "movement_history_points": len(self._movement_history),
+            "last_movement": self._movement_history[-1]
+            if self._movement_history
+            else None,
             "stationary_since": self._stationary_since,
             "is_moving": self._is_moving,
         }
@@ -354,6 +360,7 @@ class PawControlGPSHandler:
             self._current_location = (latitude, longitude)
             self._accuracy = accuracy
             self._last_update = now()
+            self._last_update_monotonic = time.monotonic()
 
             # Update entities
             await self._update_gps_entities()
@@ -407,7 +414,7 @@ class PawControlGPSHandler:
                     self._speed = calculate_speed_kmh(distance_moved, time_diff)
 
             # Movement detection
-            movement_threshold = GPS_CONFIG["movement_threshold"]
+            movement_threshold = GPS.movement_threshold
             if distance_moved >= movement_threshold:
                 self._is_moving = True
                 self._stationary_since = None
@@ -415,7 +422,7 @@ class PawControlGPSHandler:
                 self._stationary_since = self._last_update
             elif (
                 self._last_update - self._stationary_since
-            ).total_seconds() >= GPS_CONFIG["stationary_time"]:
+            ).total_seconds() >= GPS.stationary_time:
                 self._is_moving = False
 
             # Add to movement history
@@ -604,10 +611,10 @@ class PawControlGPSHandler:
             if not self._current_location or not self._home_location:
                 return
 
-            home_distance = calculate_distance(
+            home_distance = distance_from_center(
                 self._home_location, self._current_location
             )
-            movement_threshold = GPS_CONFIG["walk_detection_distance"]
+            movement_threshold = GPS.walk_detection_distance
 
             # Auto start walk
             if (
@@ -619,10 +626,7 @@ class PawControlGPSHandler:
                 moving_time = 0
                 if self._movement_history:
                     for entry in reversed(self._movement_history[-10:]):
-                        if (
-                            entry.get("distance_moved", 0)
-                            >= GPS_CONFIG["movement_threshold"]
-                        ):
+                        if entry.get("distance_moved", 0) >= GPS.movement_threshold:
                             moving_time += 30  # Assume 30 second intervals
                         else:
                             break
@@ -636,13 +640,11 @@ class PawControlGPSHandler:
                 if (
                     home_distance <= movement_threshold
                     and self._stationary_since
-                    and (now() - self._stationary_since).total_seconds() >= 300
-                ):  # 5 minutes stationary
+                    and (now() - self._stationary_since).total_seconds()
+                    >= GPS.stationary_time
+                ):
                     walk_stats = await self.async_end_walk()
-                    if (
-                        walk_stats.get("duration_minutes", 0)
-                        >= GPS_CONFIG["min_walk_duration"]
-                    ):
+                    if walk_stats.get("duration_minutes", 0) >= GPS.min_walk_duration:
                         _LOGGER.info(
                             "Auto-detected walk completed for %s", self.dog_name
                         )
@@ -668,7 +670,7 @@ class PawControlGPSHandler:
             home_radius = (
                 float(home_radius_state.state)
                 if home_radius_state
-                else GPS_CONFIG["home_zone_radius"]
+                else GPS.home_zone_radius
             )
 
             self._geofences["home"] = {
@@ -702,9 +704,9 @@ class PawControlGPSHandler:
                 fence_center = fence_config["center"]
                 fence_radius = fence_config["radius"]
 
-                # Calculate distance to fence center
-                distance = calculate_distance(fence_center, self._current_location)
-                inside_fence = distance <= fence_radius
+                inside_fence = is_within_radius(
+                    fence_center, self._current_location, fence_radius
+                )
 
                 # Check for status change
                 previous_status = self._last_geofence_status.get(fence_id, False)
@@ -727,7 +729,11 @@ class PawControlGPSHandler:
                             "set_value",
                             {
                                 "entity_id": f"input_number.{self.dog_name}_home_distance",
-                                "value": int(distance),
+                                "value": int(
+                                    distance_from_center(
+                                        fence_center, self._current_location
+                                    )
+                                ),
                             },
                         )
 
@@ -1084,11 +1090,9 @@ class PawControlGPSHandler:
     async def _gps_health_check(self) -> None:
         """Perform GPS health check."""
         try:
-            current_time = now()
-
             # Check if GPS data is stale
-            if self._last_update:
-                time_since_update = (current_time - self._last_update).total_seconds()
+            if self._last_update and self._last_update_monotonic is not None:
+                time_since_update = time.monotonic() - self._last_update_monotonic
 
                 if time_since_update > 600:  # 10 minutes without update
                     # GPS signal lost
@@ -1307,6 +1311,7 @@ class PawControlGPSHandler:
             "source_type": self._gps_source_type,
             "entity_id": self._gps_entity_id,
             "last_update": self._last_update.isoformat() if self._last_update else None,
+            "last_update_monotonic": self._last_update_monotonic,
             "accuracy": self._accuracy,
             "is_moving": self._is_moving,
             "current_speed": self._speed,
@@ -50,6 +50,11 @@ class PawControlGPSTracker(DeviceTrackerEntity):
         self._device_id = device_id
         self._attr_should_poll = False
         self._attr_source_type = SourceType.GPS
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_id)},
+            name=self._attr_name,
+            manufacturer="PawControl",
+        )
 
     @property
     def latitude(self) -> float | None:
@@ -63,14 +68,6 @@ class PawControlGPSTracker(DeviceTrackerEntity):
     def extra_state_attributes(self) -> JSONMutableMapping:
         return ensure_json_mapping({"source": self.coordinator.gps_source})
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._attr_name,
-            manufacturer="PawControl",
-        )
-
     async def async_update(self):
         await self.coordinator.async_request_refresh()
 
@@ -1,6 +1,6 @@
 """Gesundheitsmodul für Paw Control – Sensoren, Helper, Setup/Teardown."""
 
-from .const import *
+from .const import CONF_DOG_NAME, CONF_DOG_WEIGHT, DEFAULT_HEALTH_STATUS
 
 
 async def setup_health(hass, entry):
@@ -10,8 +10,18 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import slugify
 
-from .const import CONF_DOG_NAME, DOMAIN, ENTITIES, FEEDING_TYPES
-from .utils import normalize_dog_name, safe_service_call
+from .const import (
+    CONF_DOG_NAME,
+    DOMAIN,
+    FEEDING_TYPES,
+    INVALID_STATES,
+    get_entities,
+)
+from .utils import (
+    normalize_dog_name,
+    safe_batch_service_call,
+    safe_service_call,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -97,7 +107,7 @@ class PawControlDataUpdateCoordinator(DataUpdateCoordinator):
             entity_id = f"{entity_type}.{self.dog_name}_{entity_suffix}"
             state = self.hass.states.get(entity_id)
 
-            if state and state.state not in ["unknown", "unavailable"]:
+            if state and state.state not in INVALID_STATES:
                 # Convert numeric values
                 if entity_type == "input_number":
                     try:
@@ -543,13 +553,15 @@ class PawControlDataUpdateCoordinator(DataUpdateCoordinator):
                 "training_session",
             ]
 
-            for entity_suffix in boolean_entities:
-                await safe_service_call(
-                    self.hass,
-                    "input_boolean",
-                    "turn_off",
-                    {"entity_id": f"input_boolean.{self.dog_name}_{entity_suffix}"},
-                )
+            await safe_batch_service_call(
+                self.hass,
+                "input_boolean",
+                "turn_off",
+                [
+                    f"input_boolean.{self.dog_name}_{suffix}"
+                    for suffix in boolean_entities
+                ],
+            )
 
             # Reset counters
             counter_entities = [
@@ -560,13 +572,12 @@ class PawControlDataUpdateCoordinator(DataUpdateCoordinator):
                 "medication_count",
             ]
 
-            for entity_suffix in counter_entities:
-                await safe_service_call(
-                    self.hass,
-                    "counter",
-                    "reset",
-                    {"entity_id": f"counter.{self.dog_name}_{entity_suffix}"},
-                )
+            await safe_batch_service_call(
+                self.hass,
+                "counter",
+                "reset",
+                [f"counter.{self.dog_name}_{suffix}" for suffix in counter_entities],
+            )
 
             # Reset daily amounts
             number_entities = [
@@ -576,16 +587,16 @@ class PawControlDataUpdateCoordinator(DataUpdateCoordinator):
                 "daily_training_duration",
             ]
 
-            for entity_suffix in number_entities:
-                await safe_service_call(
-                    self.hass,
-                    "input_number",
-                    "set_value",
-                    {
-                        "entity_id": f"input_number.{self.dog_name}_{entity_suffix}",
-                        "value": 0,
-                    },
-                )
+            await safe_batch_service_call(
+                self.hass,
+                "input_number",
+                "set_value",
+                [
+                    f"input_number.{self.dog_name}_{suffix}"
+                    for suffix in number_entities
+                ],
+                {"value": 0},
+            )
 
             _LOGGER.info("All data reset for %s", self.dog_name)
 
@@ -604,7 +615,7 @@ class PawControlDataUpdateCoordinator(DataUpdateCoordinator):
             entity_id = f"input_number.{self.dog_name}_{entity_suffix}"
             current_state = self.hass.states.get(entity_id)
 
-            if current_state and current_state.state not in ["unknown", "unavailable"]:
+            if current_state and current_state.state not in INVALID_STATES:
                 current_value = float(current_state.state)
                 new_value = current_value + amount
 
@@ -646,105 +657,46 @@ async def async_create_helpers(
         raise
 
 
-async def _create_input_boolean_entities(hass: HomeAssistant, dog_name: str) -> None:
-    """Create input_boolean entities."""
-    for _entity_suffix, entity_config in ENTITIES.get("input_boolean", {}).items():
+async def _create_platform_helpers(
+    hass: HomeAssistant, dog_name: str, platform: str
+) -> None:
+    """Create the blueprint helpers of one platform for a dog."""
+    title = dog_name.title()
+    for _entity_suffix, spec in get_entities(platform):
         await safe_service_call(
-            hass,
-            "input_boolean",
-            "create",
-            {
-                "name": f"{dog_name.title()} {entity_config['name']}",
-                "icon": entity_config.get("icon", "mdi:dog"),
-            },
+            hass, platform, "create", spec.create_data(f"{title} {spec.name}")
         )
-
         await asyncio.sleep(0.1)  # Small delay between creations
 
 
-async def _create_input_number_entities(hass: HomeAssistant, dog_name: str) -> None:
-    """Create input_number entities."""
-    for _entity_suffix, entity_config in ENTITIES.get("input_number", {}).items():
-        service_data = {
-            "name": f"{dog_name.title()} {entity_config['name']}",
-            "min": entity_config.get("min", 0),
-            "max": entity_config.get("max", 100),
-            "step": entity_config.get("step", 1),
-            "icon": entity_config.get("icon", "mdi:dog"),
-            "mode": "slider",
-        }
+async def _create_input_boolean_entities(hass: HomeAssistant, dog_name: str) -> None:
+    """Create input_boolean entities."""
+    await _create_platform_helpers(hass, dog_name, "input_boolean")
 
-        if "initial" in entity_config:
-            service_data["initial"] = entity_config["initial"]
-        if "unit" in entity_config:
-            service_data["unit_of_measurement"] = entity_config["unit"]
 
-        await safe_service_call(hass, "input_number", "create", service_data)
-        await asyncio.sleep(0.1)
+async def _create_input_number_entities(hass: HomeAssistant, dog_name: str) -> None:
+    """Create input_number entities."""
+    await _create_platform_helpers(hass, dog_name, "input_number")
 
 
 async def _create_input_text_entities(hass: HomeAssistant, dog_name: str) -> None:
     """Create input_text entities."""
-    for _entity_suffix, entity_config in ENTITIES.get("input_text", {}).items():
-        service_data = {
-            "name": f"{dog_name.title()} {entity_config['name']}",
-            "max": entity_config.get("max", 255),
-            "icon": entity_config.get("icon", "mdi:dog"),
-            "mode": "text",
-        }
-
-        await safe_service_call(hass, "input_text", "create", service_data)
-        await asyncio.sleep(0.1)
+    await _create_platform_helpers(hass, dog_name, "input_text")
 
 
 async def _create_input_datetime_entities(hass: HomeAssistant, dog_name: str) -> None:
     """Create input_datetime entities."""
-    for _entity_suffix, entity_config in ENTITIES.get("input_datetime", {}).items():
-        service_data = {
-            "name": f"{dog_name.title()} {entity_config['name']}",
-            "has_date": entity_config.get("has_date", True),
-            "has_time": entity_config.get("has_time", True),
-            "icon": entity_config.get("icon", "mdi:dog"),
-        }
-
-        if "initial" in entity_config:
-            service_data["initial"] = entity_config["initial"]
-
-        await safe_service_call(hass, "input_datetime", "create", service_data)
-        await asyncio.sleep(0.1)
+    await _create_platform_helpers(hass, dog_name, "input_datetime")
 
 
 async def _create_counter_entities(hass: HomeAssistant, dog_name: str) -> None:
     """Create counter entities."""
-    for _entity_suffix, entity_config in ENTITIES.get("counter", {}).items():
-        service_data = {
-            "name": f"{dog_name.title()} {entity_config['name']}",
-            "initial": entity_config.get("initial", 0),
-            "step": entity_config.get("step", 1),
-            "minimum": 0,
-            "maximum": 999999,
-            "icon": entity_config.get("icon", "mdi:dog"),
-            "restore": True,
-        }
-
-        await safe_service_call(hass, "counter", "create", service_data)
-        await asyncio.sleep(0.1)
+    await _create_platform_helpers(hass, dog_name, "counter")
 
 
 async def _create_input_select_entities(hass: HomeAssistant, dog_name: str) -> None:
     """Create input_select entities."""
-    for _entity_suffix, entity_config in ENTITIES.get("input_select", {}).items():
-        service_data = {
-            "name": f"{dog_name.title()} {entity_config['name']}",
-            "options": entity_config.get("options", ["Option1", "Option2"]),
-            "icon": entity_config.get("icon", "mdi:dog"),
-        }
-
-        if "initial" in entity_config:
-            service_data["initial"] = entity_config["initial"]
-
-        await safe_service_call(hass, "input_select", "create", service_data)
-        await asyncio.sleep(0.1)
+    await _create_platform_helpers(hass, dog_name, "input_select")
 
 
 # ================================================================================
@@ -829,7 +781,10 @@ async def send_dog_notification(
                 {
                     "title": title,
                     "message": message,
-                    "notification_id": f"paw_control_{dog_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                    "notification_id": (
+                        f"{DOMAIN}_{dog_name}_"
+                        f"{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                    ),
                 },
                 blocking=False,
             )
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
-from pawcontrol.const import ATTR_DOG_NAME, ATTR_LAST_UPDATED, ICONS
+from pawcontrol.const import ATTR_DOG_NAME, ATTR_LAST_UPDATED, ICONS, INVALID_STATES
 
 from .json import JSONMutableMapping, ensure_json_mapping
 
 if TYPE_CHECKING:
     from homeassistant.util.json import JsonValueType
 
+# Gebundene Konstruktoren, spart die Attributsuche bei jedem Property-Zugriff
+_fromisoformat = datetime.fromisoformat
+_now = datetime.now
+# Erweitertes ISO-Datum am Anfang; alles andere wird gar nicht erst geparst
+_iso_date_prefix = re.compile(r"\d{4}-\d{2}-\d{2}").match
+
 
 def get_icon_by_status(status: str) -> str:
     """Mappe einen Status auf ein Icon."""
@@ -28,16 +36,28 @@ def get_icon(key: str, default: str | None = "mdi:help-circle") -> str:
     return ICONS.get(key, default)
 
 
+@lru_cache(maxsize=128)
+def _key_label(key: str) -> str:
+    """Anzeigeteil eines Schlüssels, einmal pro Schlüssel berechnet."""
+    return key.replace("_", " ").title()
+
+
+@lru_cache(maxsize=1024)
 def format_name(dog_name: str, key: str) -> str:
     """Erzeuge einen konsistent formatierten Entity-Namen."""
-    return f"{dog_name.title()} {key.replace('_', ' ').title()}"
+    return f"{dog_name.title()} {_key_label(key)}"
+
+
+def iso_now() -> str:
+    """Aktueller Zeitpunkt als ISO-8601-Zeichenkette."""
+    return _now().isoformat()
 
 
 def build_attributes(
     dog_name: str | None = None, **extra: JsonValueType
 ) -> JSONMutableMapping:
     """Erzeuge ein Attribut-Dictionary mit Standardwerten."""
-    attrs: dict[str, Any] = {ATTR_LAST_UPDATED: datetime.now().isoformat()}
+    attrs: dict[str, Any] = {ATTR_LAST_UPDATED: iso_now()}
     if dog_name:
         attrs[ATTR_DOG_NAME] = dog_name
     attrs.update(extra)
@@ -46,10 +66,15 @@ def build_attributes(
 
 def parse_datetime(value: str | None) -> datetime | None:
     """Konvertiere eine ISO-8601-Zeichenkette in ein ``datetime``-Objekt."""
-    if not value or value in ("unknown", "unavailable"):
+    if (
+        not isinstance(value, str)
+        or value in INVALID_STATES
+        or not _iso_date_prefix(value)
+    ):
         return None
     try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        # Seit Python 3.11 versteht fromisoformat das Suffix "Z" direkt
+        return _fromisoformat(value)
     except (ValueError, TypeError):
         return None
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.util import slugify
@@ -12,6 +13,16 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Meal names used in feeding reminders
+_MEAL_NAMES = MappingProxyType(
+    {
+        "morning": "Frühstück",
+        "lunch": "Mittagessen",
+        "evening": "Abendessen",
+        "snack": "Leckerli",
+    }
+)
+
 
 async def send_push_notification(
     hass: HomeAssistant,
@@ -26,17 +37,19 @@ async def send_push_notification(
     # Find home persons and their mobile devices
     recipients = []
     persons = hass.states.async_entity_ids("person")
+    notify_services = None
 
     for person_entity in persons:
         person_state = hass.states.get(person_entity)
         if person_state and person_state.state == "home":
             person_id = person_entity.split(".")[1]
-            notify_entity = f"notify.mobile_app_{person_id}"
+            service_name = f"mobile_app_{person_id}"
 
-            # Check if notify service exists
-            notify_services = hass.services.async_services().get("notify", {})
-            if notify_entity.replace("notify.", "") in notify_services:
-                recipients.append(notify_entity)
+            # Check if notify service exists; the registry is read only once
+            if notify_services is None:
+                notify_services = hass.services.async_services().get("notify", {})
+            if service_name in notify_services:
+                recipients.append(f"notify.{service_name}")
 
     # Send notifications
     if not recipients:
@@ -67,14 +80,7 @@ async def send_feeding_reminder(
 ) -> None:
     """Send a feeding reminder notification."""
 
-    meal_names = {
-        "morning": "Frühstück",
-        "lunch": "Mittagessen",
-        "evening": "Abendessen",
-        "snack": "Leckerli",
-    }
-
-    meal_name = meal_names.get(meal_type, meal_type)
+    meal_name = _MEAL_NAMES.get(meal_type, meal_type)
     message = f"Zeit für {meal_name} für {dog_name.title()}! 🍽️"
 
     actions = [
@@ -7,9 +7,16 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.number import NumberDeviceClass
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    GEOFENCE_MAX_RADIUS,
+    GEOFENCE_MIN_RADIUS,
+    RANGE_AGE,
+    RANGE_WEIGHT,
+    Icon,
+    Unit,
+)
 from .entities import PawControlNumberEntity
-from .helpers.entity import get_icon
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -24,26 +31,26 @@ _LOGGER = logging.getLogger(__name__)
 NUMBER_ENTITIES: list[dict] = [
     {
         "key": "weight",
-        "unit": "kg",
+        "unit": RANGE_WEIGHT.unit,
         "device_class": NumberDeviceClass.WEIGHT,
-        "min_value": 0.5,
-        "max_value": 100.0,
-        "step": 0.1,
+        "min_value": RANGE_WEIGHT.min,
+        "max_value": RANGE_WEIGHT.max,
+        "step": RANGE_WEIGHT.step,
         "mode": "slider",
     },
     {
         "key": "age_years",
         "icon": "mdi:calendar",
-        "unit": "Jahre",
-        "min_value": 0,
-        "max_value": 25,
+        "unit": Unit.YEARS_DE,
+        "min_value": RANGE_AGE.min,
+        "max_value": RANGE_AGE.max,
         "step": 0.1,
         "mode": "slider",
     },
     {
         "key": "temperature",
         "device_class": NumberDeviceClass.TEMPERATURE,
-        "unit": "°C",
+        "unit": Unit.CELSIUS,
         "min_value": 35.0,
         "max_value": 42.0,
         "step": 0.1,
@@ -51,8 +58,8 @@ NUMBER_ENTITIES: list[dict] = [
     },
     {
         "key": "daily_food_amount",
-        "icon": get_icon("food"),
-        "unit": "g",
+        "icon": Icon.FOOD,
+        "unit": Unit.GRAMS,
         "min_value": 0,
         "max_value": 2000,
         "step": 10,
@@ -60,9 +67,9 @@ NUMBER_ENTITIES: list[dict] = [
     },
     {
         "key": "daily_walk_duration",
-        "icon": get_icon("walk"),
+        "icon": Icon.WALK,
         "device_class": NumberDeviceClass.DURATION,
-        "unit": "min",
+        "unit": Unit.MINUTES,
         "min_value": 0,
         "max_value": 480,
         "step": 5,
@@ -70,9 +77,9 @@ NUMBER_ENTITIES: list[dict] = [
     },
     {
         "key": "daily_play_duration",
-        "icon": get_icon("play"),
+        "icon": Icon.PLAY,
         "device_class": NumberDeviceClass.DURATION,
-        "unit": "min",
+        "unit": Unit.MINUTES,
         "min_value": 0,
         "max_value": 240,
         "step": 5,
@@ -80,95 +87,95 @@ NUMBER_ENTITIES: list[dict] = [
     },
     {
         "key": "gps_signal_strength",
-        "icon": get_icon("signal"),
+        "icon": Icon.SIGNAL,
         "device_class": NumberDeviceClass.SIGNAL_STRENGTH,
-        "unit": "%",
+        "unit": Unit.PERCENT,
         "min_value": 0,
         "max_value": 100,
     },
     {
         "key": "gps_battery_level",
-        "icon": get_icon("battery"),
-        "unit": "%",
+        "icon": Icon.BATTERY,
+        "unit": Unit.PERCENT,
         "min_value": 0,
         "max_value": 100,
     },
     {
         "key": "home_distance",
-        "icon": get_icon("home"),
-        "unit": "m",
+        "icon": Icon.HOME,
+        "unit": Unit.METERS,
         "min_value": 0,
         "max_value": 10000,
     },
     {
         "key": "geofence_radius",
-        "icon": get_icon("home"),
-        "unit": "m",
-        "min_value": 10,
-        "max_value": 10000,
+        "icon": Icon.HOME,
+        "unit": Unit.METERS,
+        "min_value": GEOFENCE_MIN_RADIUS,
+        "max_value": GEOFENCE_MAX_RADIUS,
     },
     {
         "key": "current_walk_distance",
-        "icon": get_icon("walk"),
-        "unit": "m",
+        "icon": Icon.WALK,
+        "unit": Unit.METERS,
         "min_value": 0,
         "max_value": 100000,
     },
     {
         "key": "current_walk_duration",
-        "icon": get_icon("walk"),
+        "icon": Icon.WALK,
         "device_class": NumberDeviceClass.DURATION,
-        "unit": "min",
+        "unit": Unit.MINUTES,
         "min_value": 0,
         "max_value": 1440,
     },
     {
         "key": "current_walk_speed",
-        "icon": get_icon("walk"),
-        "unit": "km/h",
+        "icon": Icon.WALK,
+        "unit": Unit.KM_PER_HOUR,
         "min_value": 0,
         "max_value": 50,
         "step": 0.1,
     },
     {
         "key": "walk_distance_today",
-        "icon": get_icon("walk"),
-        "unit": "km",
+        "icon": Icon.WALK,
+        "unit": Unit.KILOMETERS,
         "min_value": 0,
         "max_value": 100,
     },
     {
         "key": "walk_distance_weekly",
-        "icon": get_icon("walk"),
-        "unit": "km",
+        "icon": Icon.WALK,
+        "unit": Unit.KILOMETERS,
         "min_value": 0,
         "max_value": 1000,
     },
     {
         "key": "calories_burned_walk",
-        "icon": get_icon("statistics"),
-        "unit": "kcal",
+        "icon": Icon.STATISTICS,
+        "unit": Unit.KCAL,
         "min_value": 0,
         "max_value": 5000,
     },
     {
         "key": "health_score",
-        "icon": get_icon("health"),
-        "unit": "%",
+        "icon": Icon.HEALTH,
+        "unit": Unit.PERCENT,
         "min_value": 0,
         "max_value": 100,
     },
     {
         "key": "happiness_score",
-        "icon": get_icon("status"),
-        "unit": "%",
+        "icon": Icon.STATUS,
+        "unit": Unit.PERCENT,
         "min_value": 0,
         "max_value": 100,
     },
     {
         "key": "activity_score",
-        "icon": get_icon("statistics"),
-        "unit": "%",
+        "icon": Icon.STATISTICS,
+        "unit": Unit.PERCENT,
         "min_value": 0,
         "max_value": 100,
     },
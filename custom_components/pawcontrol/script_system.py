@@ -10,9 +10,9 @@ from .const import (
     CONF_DOG_NAME,
     DOMAIN,
     FEEDING_TYPES,
-    MEAL_TYPES,
+    is_valid_feeding_type,
 )
-from .utils import register_services
+from .utils import get_meal_label, register_services
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -133,6 +133,20 @@ class PawControlScriptManager:
         if category in self._service_stats:
             self._service_stats[category] += 1
 
+    async def _async_set_activity_time(self, entity_id: str) -> None:
+        """Stamp ``entity_id`` and the dog's last activity with one service call."""
+        await self.hass.services.async_call(
+            "input_datetime",
+            "set_datetime",
+            {
+                "entity_id": [
+                    entity_id,
+                    f"input_datetime.{self._dog_name}_last_activity",
+                ],
+                "datetime": datetime.now().isoformat(),
+            },
+        )
+
     # FEEDING SERVICES
 
     async def _feed_dog_service(self, call: ServiceCall) -> None:
@@ -150,7 +164,7 @@ class PawControlScriptManager:
                 meal_type = await self._determine_current_meal()
 
             # Validate meal type
-            if meal_type not in FEEDING_TYPES:
+            if not is_valid_feeding_type(meal_type):
                 _LOGGER.warning("Invalid meal type: %s", meal_type)
                 return
 
@@ -158,7 +172,7 @@ class PawControlScriptManager:
             await self._execute_feeding_action(meal_type, portion_size, notes)
 
             # Send notification
-            meal_name = MEAL_TYPES.get(meal_type, meal_type)
+            meal_name = get_meal_label(meal_type)
             await self._send_notification(
                 f"🍽️ Fütterung - {self._dog_name.title()}",
                 f"{meal_name} gegeben ({portion_size})",
@@ -187,28 +201,11 @@ class PawControlScriptManager:
                 "counter", "increment", {"entity_id": counter_entity}
             )
 
-            # Update last feeding time
+            # Update last feeding time and the general last activity
             last_feeding_entity = (
                 f"input_datetime.{self._dog_name}_last_feeding_{meal_type}"
             )
-            await self.hass.services.async_call(
-                "input_datetime",
-                "set_datetime",
-                {
-                    "entity_id": last_feeding_entity,
-                    "datetime": datetime.now().isoformat(),
-                },
-            )
-
-            # Update general last activity
-            await self.hass.services.async_call(
-                "input_datetime",
-                "set_datetime",
-                {
-                    "entity_id": f"input_datetime.{self._dog_name}_last_activity",
-                    "datetime": datetime.now().isoformat(),
-                },
-            )
+            await self._async_set_activity_time(last_feeding_entity)
 
             # Add notes if provided
             if notes:
@@ -312,24 +309,9 @@ class PawControlScriptManager:
                 {"entity_id": f"counter.{self._dog_name}_walk_count"},
             )
 
-            # Update last walk time
-            await self.hass.services.async_call(
-                "input_datetime",
-                "set_datetime",
-                {
-                    "entity_id": f"input_datetime.{self._dog_name}_last_walk",
-                    "datetime": datetime.now().isoformat(),
-                },
-            )
-
-            # Update last activity
-            await self.hass.services.async_call(
-                "input_datetime",
-                "set_datetime",
-                {
-                    "entity_id": f"input_datetime.{self._dog_name}_last_activity",
-                    "datetime": datetime.now().isoformat(),
-                },
+            # Update last walk time and the general last activity
+            await self._async_set_activity_time(
+                f"input_datetime.{self._dog_name}_last_walk"
             )
 
             # Mark as having been outside and walked today
@@ -408,24 +390,9 @@ class PawControlScriptManager:
                 {"entity_id": f"counter.{self._dog_name}_play_count"},
             )
 
-            # Update last play time
-            await self.hass.services.async_call(
-                "input_datetime",
-                "set_datetime",
-                {
-                    "entity_id": f"input_datetime.{self._dog_name}_last_play",
-                    "datetime": datetime.now().isoformat(),
-                },
-            )
-
-            # Update last activity
-            await self.hass.services.async_call(
-                "input_datetime",
-                "set_datetime",
-                {
-                    "entity_id": f"input_datetime.{self._dog_name}_last_activity",
-                    "datetime": datetime.now().isoformat(),
-                },
+            # Update last play time and the general last activity
+            await self._async_set_activity_time(
+                f"input_datetime.{self._dog_name}_last_play"
             )
 
             # Mark as played today
@@ -437,7 +404,7 @@ class PawControlScriptManager:
 
             # Update play duration if entity exists
             if duration:
-                duration_entity = f"input_number.{self._dog_name}_daily_play_time"
+                duration_entity = f"input_number.{self._dog_name}_daily_play_duration"
                 await self.hass.services.async_call(
                     "input_number",
                     "set_value",
@@ -506,24 +473,9 @@ class PawControlScriptManager:
                 {"entity_id": f"counter.{self._dog_name}_training_count"},
             )
 
-            # Update last training time
-            await self.hass.services.async_call(
-                "input_datetime",
-                "set_datetime",
-                {
-                    "entity_id": f"input_datetime.{self._dog_name}_last_training",
-                    "datetime": datetime.now().isoformat(),
-                },
-            )
-
-            # Update last activity
-            await self.hass.services.async_call(
-                "input_datetime",
-                "set_datetime",
-                {
-                    "entity_id": f"input_datetime.{self._dog_name}_last_activity",
-                    "datetime": datetime.now().isoformat(),
-                },
+            # Update last training time and the general last activity
+            await self._async_set_activity_time(
+                f"input_datetime.{self._dog_name}_last_training"
             )
 
             # Update training duration
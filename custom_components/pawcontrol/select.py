@@ -7,16 +7,18 @@ from typing import TYPE_CHECKING
 
 from .const import (
     ACTIVITY_LEVELS,
+    APPETITE_LEVEL_OPTIONS,
     DOMAIN,
     EMERGENCY_LEVELS,
     ENERGY_LEVEL_OPTIONS,
+    GPS_SOURCE_TYPES,
     HEALTH_STATUS_OPTIONS,
     MOOD_OPTIONS,
     SIZE_CATEGORIES,
     WALK_TYPES,
+    Icon,
 )
 from .entities import PawControlSelectEntity
-from .helpers.entity import get_icon
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -32,41 +34,27 @@ SELECT_ENTITIES: list[dict] = [
     {
         "key": "health_status",
         "options": HEALTH_STATUS_OPTIONS,
-        "icon": get_icon("health"),
+        "icon": Icon.HEALTH,
     },
-    {"key": "mood", "options": MOOD_OPTIONS, "icon": get_icon("mood")},
+    {"key": "mood", "options": MOOD_OPTIONS, "icon": Icon.MOOD},
     {"key": "energy_level", "options": ENERGY_LEVEL_OPTIONS, "icon": "mdi:battery"},
     {
         "key": "appetite_level",
-        "options": [
-            "Kein Appetit",
-            "Wenig Appetit",
-            "Normal",
-            "Guter Appetit",
-            "Sehr guter Appetit",
-        ],
-        "icon": get_icon("food"),
+        "options": APPETITE_LEVEL_OPTIONS,
+        "icon": Icon.FOOD,
     },
-    {"key": "activity_level", "options": ACTIVITY_LEVELS, "icon": get_icon("walk")},
-    {"key": "preferred_walk_type", "options": WALK_TYPES, "icon": get_icon("walk")},
-    {"key": "size_category", "options": SIZE_CATEGORIES, "icon": get_icon("weight")},
+    {"key": "activity_level", "options": ACTIVITY_LEVELS, "icon": Icon.WALK},
+    {"key": "preferred_walk_type", "options": WALK_TYPES, "icon": Icon.WALK},
+    {"key": "size_category", "options": SIZE_CATEGORIES, "icon": Icon.WEIGHT},
     {
         "key": "emergency_level",
         "options": EMERGENCY_LEVELS,
-        "icon": get_icon("emergency"),
+        "icon": Icon.EMERGENCY,
     },
     {
         "key": "gps_source_type",
-        "options": [
-            "Manual",
-            "Smartphone",
-            "Device Tracker",
-            "Person Entity",
-            "Tractive",
-            "Webhook",
-            "MQTT",
-        ],
-        "icon": get_icon("gps"),
+        "options": GPS_SOURCE_TYPES,
+        "icon": Icon.GPS,
     },
 ]
 
@@ -7,9 +7,9 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import SensorDeviceClass
 
-from .const import DOMAIN
+from .const import DOMAIN, Icon, Unit
 from .entities import PawControlSensorEntity
-from .helpers.entity import get_icon, parse_datetime
+from .helpers.entity import parse_datetime
 from .helpers.json import JSONMutableMapping, ensure_json_mapping
 
 if TYPE_CHECKING:
@@ -125,7 +125,7 @@ class PawControlLastWalkSensor(PawControlSensorEntity):
             dog_name=dog_name,
             key="last_walk",
             device_class=SensorDeviceClass.TIMESTAMP,
-            icon=get_icon("walk"),
+            icon=Icon.WALK,
         )
 
     @property
@@ -148,7 +148,7 @@ class PawControlWalkCountSensor(PawControlSensorEntity):
     def __init__(self, coordinator: PawControlCoordinator, dog_name: str) -> None:
         """Initialize the sensor."""
         super().__init__(
-            coordinator, dog_name=dog_name, key="walk_count", icon=get_icon("walk")
+            coordinator, dog_name=dog_name, key="walk_count", icon=Icon.WALK
         )
 
     @property
@@ -170,9 +170,9 @@ class PawControlWeightSensor(PawControlSensorEntity):
             coordinator,
             dog_name=dog_name,
             key="weight",
-            icon=get_icon("weight"),
+            icon=Icon.WEIGHT,
             device_class=SensorDeviceClass.WEIGHT,
-            unit="kg",
+            unit=Unit.KILOGRAMS,
         )
 
     @property
@@ -275,8 +275,8 @@ class PawControlGPSSignalSensor(PawControlSensorEntity):
             coordinator,
             dog_name=dog_name,
             key="gps_signal",
-            icon=get_icon("signal"),
-            unit="%",
+            icon=Icon.SIGNAL,
+            unit=Unit.PERCENT,
         )
 
     @property
@@ -298,7 +298,7 @@ class PawControlHappinessSensor(PawControlSensorEntity):
             coordinator,
             dog_name=dog_name,
             key="happiness_status",
-            icon=get_icon("mood"),
+            icon=Icon.MOOD,
         )
 
     @property
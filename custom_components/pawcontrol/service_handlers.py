@@ -18,7 +18,7 @@ from .const import (
     SERVICE_VET_DATE,
     SERVICE_WEIGHT,
 )
-from .utils import safe_service_call
+from .utils import safe_batch_service_call, safe_service_call
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -396,8 +396,9 @@ async def reset_all_entities(hass: HomeAssistant, dog_name: str, data: dict) ->
             f"input_boolean.{dog_name}_medication_given",
         ]
 
-        for entity in boolean_entities:
-            await _svc(hass, "input_boolean", "turn_off", entity)
+        await safe_batch_service_call(
+            hass, "input_boolean", "turn_off", boolean_entities
+        )
 
         # Reset counters
         counter_entities = [
@@ -407,8 +408,7 @@ async def reset_all_entities(hass: HomeAssistant, dog_name: str, data: dict) ->
             f"counter.{dog_name}_medication_count",
         ]
 
-        for entity in counter_entities:
-            await _svc(hass, "counter", "reset", entity)
+        await safe_batch_service_call(hass, "counter", "reset", counter_entities)
 
         # Reset number entities
         number_entities = [
@@ -416,8 +416,9 @@ async def reset_all_entities(hass: HomeAssistant, dog_name: str, data: dict) ->
             f"input_number.{dog_name}_daily_walk_duration",
         ]
 
-        for entity in number_entities:
-            await _svc(hass, "input_number", "set_value", entity, value=0)
+        await safe_batch_service_call(
+            hass, "input_number", "set_value", number_entities, {"value": 0}
+        )
 
         _LOGGER.info("Reset all entities for %s", dog_name)
 
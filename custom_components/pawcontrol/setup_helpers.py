@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.counter import DOMAIN as COUNTER_DOMAIN
@@ -20,6 +21,8 @@ from homeassistant.util.dt import now
 from .utils import safe_service_call
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,13 +31,15 @@ _LOGGER = logging.getLogger(__name__)
 COUNTER_HELPERS = ("feeding", "walk", "potty")
 
 # Default configuration for newly created counters
-COUNTER_CONFIG: dict[str, Any] = {
-    "initial": 0,
-    "minimum": 0,
-    "maximum": 20,
-    "step": 1,
-    "restore": True,
-}
+COUNTER_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "initial": 0,
+        "minimum": 0,
+        "maximum": 20,
+        "step": 1,
+        "restore": True,
+    }
+)
 
 
 async def _call_service(
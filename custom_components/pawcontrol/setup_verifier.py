@@ -8,6 +8,7 @@ from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from .const import INVALID_STATES
 from .utils import safe_service_call
 
 if TYPE_CHECKING:
@@ -51,7 +52,7 @@ def _categorize_entity(
         return
 
     report.critical_entities_found += 1
-    if state.state in ["unknown", "unavailable"]:
+    if state.state in INVALID_STATES:
         report.critical_entities_broken.append(entity_id)
     else:
         report.critical_entities_working.append(entity_id)
@@ -116,7 +117,7 @@ async def async_repair_broken_entities(
             if not state:
                 needs_repair = True
                 repair_reason = "Entity does not exist"
-            elif state.state in ["unknown", "unavailable"]:
+            elif state.state in INVALID_STATES:
                 needs_repair = True
                 repair_reason = f"Entity in invalid state: {state.state}"
             elif not state.attributes.get("friendly_name"):
@@ -406,19 +407,20 @@ async def async_verify_and_fix_installation(
 
 async def _get_expected_entities(dog_name: str) -> dict[str, dict[str, Any]]:
     """Get dictionary of all expected entities for a dog."""
-    from .const import ENTITIES
+    from .const import ENTITY_COLUMNS
 
     expected_entities = {}
+    dog_title = dog_name.title()
 
-    # Process each entity type from ENTITIES constant
-    for entity_type, entities_config in ENTITIES.items():
-        for entity_suffix, entity_config in entities_config.items():
+    # Process each entity type from the column view of the ENTITIES blueprint
+    for entity_type, columns in ENTITY_COLUMNS.items():
+        for entity_suffix, name, icon, entity_config in zip(*columns, strict=True):
             entity_id = f"{entity_type}.{dog_name}_{entity_suffix}"
 
             expected_entities[entity_id] = {
                 "domain": entity_type,
-                "friendly_name": f"{dog_name.title()} {entity_config['name']}",
-                "icon": entity_config.get("icon", "mdi:dog"),
+                "friendly_name": f"{dog_title} {name}",
+                "icon": icon,
                 "config": entity_config,
             }
 
@@ -432,9 +434,9 @@ async def _create_missing_entity(
     try:
         domain = entity_info["domain"]
         friendly_name = entity_info["friendly_name"]
-        config = entity_info.get("config", {})
+        spec = entity_info["config"]
 
-        service_data = {"name": friendly_name, **config}
+        service_data = spec.create_data(friendly_name)
 
         await asyncio.wait_for(
             hass.services.async_call(domain, "create", service_data, blocking=True),
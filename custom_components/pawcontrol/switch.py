@@ -6,9 +6,8 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from .const import DOMAIN
+from .const import DOMAIN, Icon
 from .entities import PawControlSwitchEntity
-from .helpers.entity import get_icon
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -58,7 +57,7 @@ class PawControlEmergencyModeSwitch(PawControlSwitchEntity):
             coordinator,
             dog_name=dog_name,
             key="emergency_mode",
-            icon=get_icon("emergency"),
+            icon=Icon.EMERGENCY,
         )
 
     @property
@@ -165,7 +164,7 @@ class PawControlVisitorModeSwitch(PawControlSwitchEntity):
     def __init__(self, coordinator: PawControlCoordinator, dog_name: str) -> None:
         """Initialize the switch."""
         super().__init__(
-            coordinator, dog_name=dog_name, key="visitor_mode", icon=get_icon("visitor")
+            coordinator, dog_name=dog_name, key="visitor_mode", icon=Icon.VISITOR
         )
 
     @property
@@ -263,7 +262,7 @@ class PawControlAutoWalkDetectionSwitch(PawControlSwitchEntity):
             coordinator,
             dog_name=dog_name,
             key="auto_walk_detection",
-            icon=get_icon("automation"),
+            icon=Icon.AUTOMATION,
         )
 
     @property
@@ -332,7 +331,7 @@ class PawControlWalkInProgressSwitch(PawControlSwitchEntity):
             coordinator,
             dog_name=dog_name,
             key="walk_in_progress",
-            icon=get_icon("walk"),
+            icon=Icon.WALK,
         )
 
     @property
@@ -417,7 +416,7 @@ class PawControlTrainingSessionSwitch(PawControlSwitchEntity):
             coordinator,
             dog_name=dog_name,
             key="training_session",
-            icon=get_icon("training"),
+            icon=Icon.TRAINING,
         )
 
     @property
@@ -488,7 +487,7 @@ class PawControlPlaytimeSessionSwitch(PawControlSwitchEntity):
             coordinator,
             dog_name=dog_name,
             key="playtime_session",
-            icon=get_icon("play"),
+            icon=Icon.PLAY,
         )
 
     @property
@@ -568,7 +567,7 @@ class PawControlMedicationReminderSwitch(PawControlSwitchEntity):
             coordinator,
             dog_name=dog_name,
             key="medication_reminder",
-            icon=get_icon("medication"),
+            icon=Icon.MEDICATION,
         )
 
     @property
@@ -640,7 +639,7 @@ class PawControlHealthMonitoringSwitch(PawControlSwitchEntity):
             coordinator,
             dog_name=dog_name,
             key="health_monitoring",
-            icon=get_icon("health"),
+            icon=Icon.HEALTH,
         )
 
     @property
@@ -7,9 +7,8 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.text import TextMode
 
-from .const import DOMAIN
+from .const import DOMAIN, Icon
 from .entities import PawControlTextEntity
-from .helpers.entity import get_icon
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -32,58 +31,58 @@ TEXT_ENTITIES: list[dict] = [
     },
     {
         "key": "health_notes",
-        "icon": get_icon("health"),
+        "icon": Icon.HEALTH,
         "max_length": 255,
         "mode": TextMode.TEXT,
     },
     {
         "key": "medication_notes",
-        "icon": get_icon("medication"),
+        "icon": Icon.MEDICATION,
         "max_length": 255,
         "mode": TextMode.TEXT,
     },
-    {"key": "vet_contact", "icon": get_icon("vet"), "max_length": 255},
-    {"key": "current_location", "icon": get_icon("location"), "max_length": 100},
-    {"key": "home_coordinates", "icon": get_icon("home"), "max_length": 50},
+    {"key": "vet_contact", "icon": Icon.VET, "max_length": 255},
+    {"key": "current_location", "icon": Icon.LOCATION, "max_length": 100},
+    {"key": "home_coordinates", "icon": Icon.HOME, "max_length": 50},
     {
         "key": "current_walk_route",
-        "icon": get_icon("walk"),
+        "icon": Icon.WALK,
         "max_length": 1000,
         "mode": TextMode.TEXT,
     },
     {
         "key": "favorite_walk_routes",
-        "icon": get_icon("walk"),
+        "icon": Icon.WALK,
         "max_length": 1000,
         "mode": TextMode.TEXT,
     },
-    {"key": "gps_tracker_status", "icon": get_icon("gps"), "max_length": 255},
+    {"key": "gps_tracker_status", "icon": Icon.GPS, "max_length": 255},
     {
         "key": "gps_tracker_config",
-        "icon": get_icon("settings"),
+        "icon": Icon.SETTINGS,
         "max_length": 1000,
         "mode": TextMode.TEXT,
     },
-    {"key": "visitor_name", "icon": get_icon("visitor"), "max_length": 100},
+    {"key": "visitor_name", "icon": Icon.VISITOR, "max_length": 100},
     {
         "key": "visitor_instructions",
-        "icon": get_icon("visitor"),
+        "icon": Icon.VISITOR,
         "max_length": 500,
         "mode": TextMode.TEXT,
     },
     {
         "key": "walk_history_today",
-        "icon": get_icon("walk"),
+        "icon": Icon.WALK,
         "max_length": 500,
         "mode": TextMode.TEXT,
     },
     {
         "key": "activity_history",
-        "icon": get_icon("statistics"),
+        "icon": Icon.STATISTICS,
         "max_length": 1000,
         "mode": TextMode.TEXT,
     },
-    {"key": "last_activity", "icon": get_icon("status"), "max_length": 255},
+    {"key": "last_activity", "icon": Icon.STATUS, "max_length": 255},
 ]
 
 
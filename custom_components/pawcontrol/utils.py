@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import logging
 import re
-from datetime import UTC, datetime, timedelta
-from math import atan2, cos, isfinite, radians, sin, sqrt
+from bisect import bisect_left
+from datetime import UTC, datetime, time, timedelta
+from functools import lru_cache
+from math import atan2, cos, isfinite, isnan, pi, radians, sin, sqrt
 from typing import TYPE_CHECKING, Any, cast
 
 from homeassistant.util import slugify
@@ -22,17 +24,23 @@ from .const import (
     DEFAULT_FEEDING_TIMES,
     DEFAULT_WALK_DURATION,
     DOG_NAME_PATTERN,
+    DOMAIN,
     GPS_ACCURACY_THRESHOLDS,
-    MAX_DOG_AGE,
+    INVALID_STATES,
     MAX_DOG_NAME_LENGTH,
-    MIN_DOG_AGE,
+    MEAL_ICONS,
+    MEAL_TYPES,
     MIN_DOG_NAME_LENGTH,
+    VALIDATION_RANGES,
     VALIDATION_RULES,
+    VITAL_SIGN_RANGES,
+    Icon,
+    VRule,
 )
 from .exceptions import InvalidCoordinates
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    from collections.abc import Callable, Iterable, Mapping
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
@@ -41,10 +49,35 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Earth's radius in meters
+_EARTH_RADIUS_M = 6371000
+
+# Meridian arc length of one degree of latitude, used as a cheap lower bound
+_METERS_PER_DEGREE_LAT = _EARTH_RADIUS_M * pi / 180
+
+# Sorted upper bounds (inclusive) and labels for get_gps_accuracy_level
+_GPS_ACCURACY_BOUNDS = (
+    GPS_ACCURACY_THRESHOLDS["excellent"],
+    GPS_ACCURACY_THRESHOLDS["good"],
+    GPS_ACCURACY_THRESHOLDS["acceptable"],
+)
+_GPS_ACCURACY_LABELS = ("Ausgezeichnet", "Gut", "Akzeptabel", "Schlecht")
+
+# Flattened (field, range) pairs for is_emergency_situation
+_VITAL_SIGN_ITEMS = tuple(VITAL_SIGN_RANGES.items())
+
+# Flattened (field, range) pairs for validate_data_against_rules
+_VALIDATION_ITEMS = tuple(VALIDATION_RULES.items())
+
 
 # Precompile dog name pattern for reuse
 DOG_NAME_RE = re.compile(DOG_NAME_PATTERN)
 
+# Bound lookups for the fixed meal tables; avoids the attribute lookup per call
+_meal_label_get = MEAL_TYPES.get
+_meal_icon_get = MEAL_ICONS.get
+_DEFAULT_MEAL_ICON = Icon.FOOD
+
 
 def merge_entry_options(entry: ConfigEntry) -> PawControlConfigData:
     """Merge config entry data and options.
@@ -133,7 +166,8 @@ def validate_age(age: int) -> bool:
     """Validate dog age."""
     try:
         age = int(age)
-        return MIN_DOG_AGE <= age <= MAX_DOG_AGE
+        age_range = VALIDATION_RANGES[VRule.AGE]
+        return age_range.min <= age <= age_range.max
     except (ValueError, TypeError):
         return False
 
@@ -167,22 +201,60 @@ def calculate_distance(
         msg = "Invalid GPS coordinates provided"
         raise InvalidCoordinates(msg)
 
-    lat1, lon1 = coord1
-    lat2, lon2 = coord2
-
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    # Convert to radians without building an intermediate list
+    lat1 = radians(coord1[0])
+    lat2 = radians(coord2[0])
+    dlat = lat2 - lat1
+    dlon = radians(coord2[1] - coord1[1])
 
     # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
     a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
     c = 2 * atan2(sqrt(a), sqrt(1 - a))
 
-    # Earth's radius in meters
-    r = 6371000
+    return _EARTH_RADIUS_M * c
+
 
-    return r * c
+@lru_cache(maxsize=32)
+def _center_trig(latitude: float, longitude: float) -> tuple[float, float, float]:
+    """Return ``(lat_rad, lon_rad, cos_lat)`` for a fixed reference point."""
+    lat_rad = radians(latitude)
+    return lat_rad, radians(longitude), cos(lat_rad)
+
+
+def distance_from_center(
+    center: tuple[float, float], coord: tuple[float, float]
+) -> float:
+    """Calculate the distance in meters from a fixed center to ``coord``.
+
+    Equivalent to :func:`calculate_distance`, but the trigonometry of the
+    center (home location, geofence centers) is computed once and cached.
+    """
+    if not validate_coordinates(center[0], center[1]) or not validate_coordinates(
+        coord[0], coord[1]
+    ):
+        msg = "Invalid GPS coordinates provided"
+        raise InvalidCoordinates(msg)
+
+    lat1, lon1, cos_lat1 = _center_trig(center[0], center[1])
+    lat2 = radians(coord[0])
+    dlat = lat2 - lat1
+    dlon = radians(coord[1]) - lon1
+
+    a = sin(dlat / 2) ** 2 + cos_lat1 * cos(lat2) * sin(dlon / 2) ** 2
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+
+    return _EARTH_RADIUS_M * c
+
+
+def is_within_radius(
+    center: tuple[float, float], coord: tuple[float, float], radius: float
+) -> bool:
+    """Return whether ``coord`` lies within ``radius`` meters of ``center``."""
+    # The great-circle distance is never shorter than the latitude difference,
+    # so points outside that band are rejected without any trigonometry.
+    if abs(coord[0] - center[0]) * _METERS_PER_DEGREE_LAT > radius:
+        return False
+    return distance_from_center(center, coord) <= radius
 
 
 def format_duration(minutes: int | float | str) -> str:
@@ -245,13 +317,19 @@ def format_weight(kg: float) -> str:
 
 def get_gps_accuracy_level(accuracy: float) -> str:
     """Get GPS accuracy level description."""
-    if accuracy <= GPS_ACCURACY_THRESHOLDS["excellent"]:
-        return "Ausgezeichnet"
-    if accuracy <= GPS_ACCURACY_THRESHOLDS["good"]:
-        return "Gut"
-    if accuracy <= GPS_ACCURACY_THRESHOLDS["acceptable"]:
-        return "Akzeptabel"
-    return "Schlecht"
+    if isnan(accuracy):  # NaN fails every threshold comparison
+        return _GPS_ACCURACY_LABELS[-1]
+    return _GPS_ACCURACY_LABELS[bisect_left(_GPS_ACCURACY_BOUNDS, accuracy)]
+
+
+def get_gps_accuracy_levels(accuracies: Iterable[float]) -> list[str]:
+    """Get GPS accuracy level descriptions for a batch of readings."""
+    labels = _GPS_ACCURACY_LABELS
+    bounds = _GPS_ACCURACY_BOUNDS
+    return [
+        labels[-1] if isnan(accuracy) else labels[bisect_left(bounds, accuracy)]
+        for accuracy in accuracies
+    ]
 
 
 def calculate_dog_calories_per_day(
@@ -332,6 +410,8 @@ def safe_float_convert(value: Any, default: float = 0.0) -> float:
 
 def safe_int_convert(value: Any, default: int = 0) -> int:
     """Safely convert value to int."""
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
     try:
         return int(float(value))
     except (ValueError, TypeError):
@@ -425,7 +505,7 @@ def time_since_last_activity(last_activity_time: str | datetime) -> timedelta:
     consistently.
     """
     try:
-        if not last_activity_time or last_activity_time in ["unknown", "unavailable"]:
+        if not last_activity_time or last_activity_time in INVALID_STATES:
             return timedelta(days=999)  # Very long time if unknown
 
         if isinstance(last_activity_time, datetime):
@@ -455,6 +535,16 @@ def time_since_last_activity(last_activity_time: str | datetime) -> timedelta:
         return timedelta(days=999)
 
 
+@lru_cache(maxsize=32)
+def parse_time_of_day(value: str) -> time:
+    """Parse an ``HH:MM[:SS]`` helper state into a ``time``.
+
+    Helper states repeat the same few schedule strings, so results are cached
+    per string. Invalid values raise ``ValueError``.
+    """
+    return time.fromisoformat(value)
+
+
 def is_time_for_activity(last_activity_time: str, interval_hours: float) -> bool:
     """Check if enough time has passed for next activity."""
     time_since = time_since_last_activity(last_activity_time)
@@ -484,24 +574,22 @@ def validate_data_against_rules(data: dict[str, Any]) -> list[str]:
     """Validate data against defined validation rules."""
     errors = []
 
-    for field, value in data.items():
-        if field in VALIDATION_RULES:
-            rule = VALIDATION_RULES[field]
-
-            try:
-                num_value = float(value)
+    # Walk the few known rules instead of every submitted field
+    for field, rule in _VALIDATION_ITEMS:
+        if field not in data:
+            continue
 
-                if num_value < rule["min"]:
-                    errors.append(
-                        f"{field} must be at least {rule['min']} {rule['unit']}"
-                    )
-                elif num_value > rule["max"]:
-                    errors.append(
-                        f"{field} must be at most {rule['max']} {rule['unit']}"
-                    )
+        value = data[field]
+        try:
+            num_value = float(value)
+        except (ValueError, TypeError):
+            errors.append(f"{field} must be a valid number")
+            continue
 
-            except (ValueError, TypeError):
-                errors.append(f"{field} must be a valid number")
+        if num_value < rule.min:
+            errors.append(f"{field} must be at least {rule.min} {rule.unit}")
+        elif num_value > rule.max:
+            errors.append(f"{field} must be at most {rule.max} {rule.unit}")
 
     return errors
 
@@ -510,7 +598,7 @@ def create_backup_filename(dog_name: str, backup_type: str = "full") -> str:
     """Create backup filename with timestamp."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     dog_slug = slugify(dog_name)
-    return f"paw_control_{dog_slug}_{backup_type}_{timestamp}.json"
+    return f"{DOMAIN}_{dog_slug}_{backup_type}_{timestamp}.json"
 
 
 def normalize_dog_name(name: str) -> str:
@@ -523,6 +611,16 @@ def normalize_dog_name(name: str) -> str:
     return normalized.title()
 
 
+def get_meal_label(meal: str) -> str:
+    """Return the display label for ``meal``, falling back to the key itself."""
+    return _meal_label_get(meal, meal)
+
+
+def get_meal_icon(meal: str) -> str:
+    """Return the icon for ``meal``, falling back to the generic food icon."""
+    return _meal_icon_get(meal, _DEFAULT_MEAL_ICON)
+
+
 def get_meal_time_category(hour: int) -> str:
     """Get meal category based on hour of day."""
     if 5 <= hour < 10:
@@ -600,6 +698,51 @@ async def safe_service_call(
         return False
 
 
+async def safe_batch_service_call(
+    hass: HomeAssistant,
+    domain: str,
+    service: str,
+    entity_ids: Iterable[str],
+    data: dict[str, Any] | None = None,
+) -> bool:
+    """Call a service once for all existing entities in ``entity_ids``.
+
+    Missing entities are skipped, mirroring :func:`safe_service_call`, so a
+    daily reset costs one service call instead of one per entity. If the
+    batched call fails, each entity is retried on its own so one bad entity
+    does not block the others.
+    """
+    if not hass.services.has_service(domain, service):
+        _LOGGER.debug("Service %s.%s not available", domain, service)
+        return False
+
+    existing = [entity_id for entity_id in entity_ids if hass.states.get(entity_id)]
+    if not existing:
+        return False
+
+    service_data = {"entity_id": existing}
+    if data:
+        service_data.update(data)
+    try:
+        await hass.services.async_call(domain, service, service_data, blocking=True)
+    except Exception:
+        _LOGGER.warning(
+            "Batched %s.%s call for %d entities failed, retrying one by one",
+            domain,
+            service,
+            len(existing),
+            exc_info=True,
+        )
+        results = [
+            await safe_service_call(
+                hass, domain, service, {**service_data, "entity_id": entity_id}
+            )
+            for entity_id in existing
+        ]
+        return all(results)
+    return True
+
+
 def extract_dog_name_from_entity_id(entity_id: str) -> str:
     """Extract dog name from entity_id."""
     try:
@@ -618,7 +761,7 @@ def create_notification_id(dog_name: str, notification_type: str) -> str:
     """Create unique notification ID."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     dog_slug = slugify(dog_name)
-    return f"paw_control_{dog_slug}_{notification_type}_{timestamp}"
+    return f"{DOMAIN}_{dog_slug}_{notification_type}_{timestamp}"
 
 
 def format_time_ago(dt: datetime) -> str:
@@ -676,13 +819,13 @@ def calculate_feeding_amount_by_weight(weight_kg: float, meals_per_day: int = 2)
 
 def is_emergency_situation(health_data: dict[str, Any]) -> bool:
     """Determine if health data indicates emergency situation."""
-    emergency_indicators = [
-        health_data.get("temperature", 0) > 41.0,  # High fever
-        health_data.get("temperature", 0) < 37.0,  # Hypothermia
-        health_data.get("heart_rate", 0) > 180,  # Tachycardia
-        health_data.get("heart_rate", 0) < 50,  # Bradycardia
-        "notfall" in str(health_data.get("health_status", "")).lower(),
-        "emergency" in str(health_data.get("emergency_mode", "")).lower(),
-    ]
-
-    return any(emergency_indicators)
+    # Fever/hypothermia and tachycardia/bradycardia; stops at the first hit
+    for field, rule in _VITAL_SIGN_ITEMS:
+        value = health_data.get(field, 0)
+        if value < rule.min or value > rule.max:
+            return True
+
+    return (
+        "notfall" in str(health_data.get("health_status", "")).lower()
+        or "emergency" in str(health_data.get("emergency_mode", "")).lower()
+    )
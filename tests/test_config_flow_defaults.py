@@ -52,3 +52,21 @@ def test_feeding_times_options(monkeypatch):
             break
     else:  # pragma: no cover - defensive, should not happen
         pytest.fail("feeding times not in schema")
+
+
+def test_feeding_times_selector_is_reused():
+    """The feeding time selector is built once and shared across renders."""
+    flow = config_flow.ConfigFlow()
+    flow.hass = SimpleNamespace()
+
+    first = asyncio.run(flow.async_step_user())["data_schema"].schema
+    second = asyncio.run(flow.async_step_user())["data_schema"].schema
+
+    def selector(schema):
+        return next(
+            validator
+            for key, validator in schema.items()
+            if getattr(key, "schema", None) == CONF_FEEDING_TIMES
+        )
+
+    assert selector(first) is selector(second)
@@ -0,0 +1,230 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("."))
+
+from custom_components.pawcontrol import const
+
+
+def test_option_enumerations_are_immutable():
+    """Select options are tuples so they can be shared safely."""
+    for options in (
+        const.ACTIVITY_LEVELS,
+        const.HEALTH_STATUS_OPTIONS,
+        const.MOOD_OPTIONS,
+        const.ENERGY_LEVEL_OPTIONS,
+        const.APPETITE_LEVEL_OPTIONS,
+        const.EMERGENCY_LEVELS,
+        const.TRAINING_TYPES,
+        const.WALK_TYPES,
+        const.SIZE_CATEGORIES,
+        const.FEEDING_TYPES,
+    ):
+        assert isinstance(options, tuple)
+        assert len(set(options)) == len(options)
+
+
+def test_option_membership_helpers():
+    """The ``is_valid_*`` helpers mirror the option tuples."""
+    assert const.is_valid_activity_level("Normal")
+    assert not const.is_valid_activity_level("normal")
+    assert const.is_valid_mood("😐 Neutral")
+    assert const.is_valid_feeding_type("morning")
+    assert not const.is_valid_feeding_type("brunch")
+
+
+def test_icon_aliases_resolve_through_icons():
+    """``ICON_<KEY>`` names are served lazily from the ``ICONS`` map."""
+    assert const.ICONS["walk"] == const.ICON_WALK
+    assert "ICON_WALK" not in vars(const)
+    with pytest.raises(AttributeError):
+        _ = const.ICON_DOES_NOT_EXIST
+
+
+def test_entities_blueprint_is_a_read_only_view():
+    """``ENTITIES`` serves cached, read-only per-platform views."""
+    entities = const.ENTITIES
+    assert "input_boolean" in entities
+    assert entities["counter"] is entities["counter"]
+    with pytest.raises(TypeError):
+        entities["counter"]["walk_count"] = None
+    with pytest.raises(KeyError):
+        entities["unknown_platform"]
+
+
+def test_get_entities_returns_pregrouped_tuples():
+    """Platform lookups return cached ``(suffix, config)`` tuples."""
+    counters = const.get_entities("counter")
+    assert counters is const.get_entities("counter")
+    assert counters == tuple(const.ENTITIES["counter"].items())
+    assert const.get_entities("unknown_platform") == ()
+
+
+def test_repeated_strings_share_one_object():
+    """Interned icon strings are shared across the constant tables."""
+    boolean_icon = const.ENTITIES["input_boolean"]["feeding_morning"].icon
+    assert boolean_icon is const.ICONS["food"]
+    assert const.MEAL_ICONS["snack"] is const.ICONS["food"]
+
+
+def test_input_number_blueprint_shares_range_flyweight():
+    """``input_number`` specs reference the shared ``_Range`` objects."""
+    weight = const.ENTITIES["input_number"]["weight"]
+    assert weight.value_range is const.RANGE_WEIGHT
+    assert const.VALIDATION_RULES["weight"] is const.RANGE_WEIGHT
+    assert const.RANGE_WEIGHT.step == 0.1
+
+
+def test_meal_types_are_read_only():
+    """``MEAL_TYPES`` is a read-only view keyed by ``FEEDING_TYPES``."""
+    assert tuple(const.MEAL_TYPES) == const.FEEDING_TYPES
+    with pytest.raises(TypeError):
+        const.MEAL_TYPES["brunch"] = "Brunch"
+
+
+def test_domain_matches_manifest():
+    """A single ``DOMAIN`` spelling is shared with ``manifest.json``."""
+    manifest = json.loads(
+        Path(const.__file__).with_name("manifest.json").read_text(encoding="utf-8")
+    )
+    assert const.DOMAIN == manifest["domain"] == "pawcontrol"
+
+
+def test_icon_class_backs_icons_mapping():
+    """``ICONS`` is derived from the ``Icon`` class attributes."""
+    assert const.ICONS["walk"] == const.Icon.WALK
+    assert const.Icon.FOOD is const.ICONS["food"]
+    assert len(const.ICONS) == len(
+        [name for name in vars(const.Icon) if not name.startswith("_")]
+    )
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["GPS_ACCURACY_THRESHOLDS", "GPS_CONFIG", "ICONS", "MEAL_ICONS", "STATUS_MESSAGES"],
+)
+def test_constant_tables_are_read_only(name):
+    """Shared configuration tables cannot be mutated by callers."""
+    with pytest.raises(TypeError):
+        getattr(const, name)["new_key"] = "value"
+
+
+def test_health_status_enum_indexes_labels():
+    """``HealthStatus`` values index ``HEALTH_STATUS_OPTIONS`` by severity."""
+    assert len(const.HealthStatus) == len(const.HEALTH_STATUS_OPTIONS)
+    assert const.HealthStatus.EXCELLENT.label == "Ausgezeichnet"
+    assert const.HEALTH_STATUS_BY_LABEL["Notfall"] is const.HealthStatus.EMERGENCY
+    assert const.HealthStatus.SICK > const.HealthStatus.GOOD
+
+
+def test_gps_tuning_backs_legacy_aliases():
+    """``GPS_CONFIG`` and the radius limits are views of the ``GPS`` record."""
+    assert const.GPS_CONFIG["stationary_time"] == const.GPS.stationary_time
+    assert const.GPS.geofence_max_radius == const.GEOFENCE_MAX_RADIUS
+    with pytest.raises(AttributeError):
+        const.GPS.home_zone_radius = 1
+
+
+def test_health_status_lookup_is_built_lazily():
+    """Rarely used derived tables are registered with the lazy builders."""
+    assert "HEALTH_STATUS_BY_LABEL" in const._LAZY_BUILDERS
+    lookup = const.HEALTH_STATUS_BY_LABEL
+    assert vars(const)["HEALTH_STATUS_BY_LABEL"] is lookup
+
+
+def test_entity_columns_align_with_blueprint():
+    """The column view lists each platform's entries in blueprint order."""
+    columns = const.get_entity_columns("input_datetime")
+    group = const.ENTITIES["input_datetime"]
+    assert columns.suffixes == tuple(group)
+    assert columns.names == tuple(config.name for config in group.values())
+    assert columns.configs[0] is next(iter(group.values()))
+    assert const.get_entity_columns("unknown_platform").suffixes == ()
+
+
+def test_blueprint_option_tuples_are_interned():
+    """String tuples inside the blueprint are interned like plain values."""
+    options = const.ENTITIES["input_select"]["health_status"].options
+    assert isinstance(options, tuple)
+    assert all(option is sys.intern(option) for option in options)
+
+
+def test_blueprint_spec_strings_are_interned():
+    """String fields of the helper specs are interned on construction."""
+    spec = const.ENTITIES["input_boolean"]["feeding_morning"]
+    assert spec.name is sys.intern("Frühstück gegeben")
+    counter = const.ENTITIES["counter"]["feeding_snack_count"]
+    assert counter.name is sys.intern("Snack-Zähler")
+
+
+def test_helper_specs_are_slotted_and_frozen():
+    """Blueprint entries are frozen slot records with a dict-style fallback."""
+    counter = const.ENTITIES["counter"]["walk_count"]
+    assert not hasattr(counter, "__dict__")
+    assert counter["step"] == counter.step == 1
+    with pytest.raises(KeyError):
+        counter["unknown"]
+    with pytest.raises(AttributeError):
+        counter.step = 2
+
+
+def test_helper_spec_builds_create_payload():
+    """``create_data`` renders the service payload of each helper platform."""
+    weight = const.ENTITIES["input_number"]["weight"]
+    data = weight.create_data("Rex Gewicht")
+    assert data["name"] == "Rex Gewicht"
+    assert data["min"] == const.RANGE_WEIGHT.min
+    assert data["unit_of_measurement"] == "kg"
+    assert "initial" not in data
+    health = const.ENTITIES["input_select"]["health_status"]
+    assert health.create_data("Rex")["options"] == list(health.options)
+
+
+def test_validation_ranges_are_indexed_by_rule():
+    """``VRule`` indexes ``VALIDATION_RANGES`` and names the string keys."""
+    assert const.VALIDATION_RANGES[const.VRule.WEIGHT] is const.RANGE_WEIGHT
+    assert const.VALIDATION_RULES["age"] is const.VALIDATION_RANGES[const.VRule.AGE]
+    assert len(const.VALIDATION_RULES) == len(const.VRule)
+
+
+def test_platform_blueprints_are_shared_with_entities():
+    """Per-platform lookups and ``ENTITIES`` share one built blueprint."""
+    ((suffix, spec),) = const.get_entities("input_text")
+    assert const.ENTITIES["input_text"][suffix] is spec
+    assert tuple(const.ENTITIES) == tuple(const._PLATFORM_BUILDERS)
+
+
+def test_option_sets_are_shared_per_tuple():
+    """Known option tuples map to their shared ``frozenset`` companion."""
+    assert const.get_option_set(const.MOOD_OPTIONS) is const._MOOD_SET
+    assert const.get_option_set(["a", "b"]) == frozenset({"a", "b"})
+    assert const.is_valid_gps_source_type("MQTT")
+
+
+def test_ranges_use_shared_unit_constants():
+    """Range records reference the ``Unit`` constants by identity."""
+    assert const.RANGE_WEIGHT.unit is const.Unit.KILOGRAMS
+    assert const.VITAL_SIGN_RANGES["temperature"].unit is const.Unit.CELSIUS
+
+
+def test_dog_status_indexes_message_texts():
+    """``DogStatus`` indexes the texts behind the string-keyed lookup."""
+    assert const.DogStatus.NEEDS_WALK.message == "Spaziergang ausstehend"
+    assert const.STATUS_MESSAGES["needs_food"] is const.DogStatus.NEEDS_FOOD.message
+    assert len(const.STATUS_MESSAGES) == len(const.STATUS_MESSAGE_TEXTS)
+
+
+def test_attr_aliases_share_the_attr_strings():
+    """``ATTR_*`` names are plain-string aliases of the ``Attr`` keys."""
+    assert const.ATTR_DOG_NAME is const.Attr.DOG_NAME
+    assert type(const.Attr.LAST_UPDATED) is str
+
+
+def test_invalid_states_cover_unknown_and_unavailable():
+    """``INVALID_STATES`` is the shared set of unusable helper states."""
+    assert frozenset({"unknown", "unavailable"}) == const.INVALID_STATES
+    assert "on" not in const.INVALID_STATES
@@ -1,6 +1,8 @@
 import asyncio
 from types import SimpleNamespace
 
+import pytest
+
 from custom_components.pawcontrol import dashboard
 
 
@@ -11,6 +13,12 @@ class DummyStates:
     def async_set(self, entity_id, state, attrs=None):
         self.calls.append((entity_id, state, attrs))
 
+    def get(self, entity_id):
+        for call_entity_id, state, _ in reversed(self.calls):
+            if call_entity_id == entity_id:
+                return SimpleNamespace(state=state)
+        return None
+
 
 def test_create_dashboard_slugifies_name():
     async def run_test() -> None:
@@ -22,3 +30,29 @@ def test_create_dashboard_slugifies_name():
         assert "sensor.mr_fido_health" in yaml_content
 
     asyncio.run(run_test())
+
+
+def test_dashboard_yaml_is_built_once_per_dog():
+    yaml_content = dashboard._build_dashboard_yaml("Rex")
+    assert dashboard._build_dashboard_yaml("Rex") is yaml_content
+    assert "Paw Control: Rex" in yaml_content
+
+
+def test_create_dashboard_skips_unchanged_yaml():
+    async def run_test() -> None:
+        hass = SimpleNamespace(states=DummyStates())
+        await dashboard.create_dashboard(hass, "Rex")
+        await dashboard.create_dashboard(hass, "Rex")
+        assert len(hass.states.calls) == 1
+
+    asyncio.run(run_test())
+
+
+def test_module_cards_are_read_only_templates():
+    with pytest.raises(TypeError):
+        dashboard.MODULE_CARDS["gps"]["title"] = "Changed"
+
+    entry = SimpleNamespace(options={"modules": ["gps", "walk"]})
+    view = asyncio.run(dashboard.async_create_dashboard(None, entry))
+    assert view["cards"][0] == dict(dashboard.MODULE_CARDS["gps"])
+    assert type(view["cards"][0]) is dict
@@ -1,7 +1,8 @@
 import asyncio
 import os
 import sys
-from datetime import datetime
+from datetime import UTC, datetime
+from types import SimpleNamespace
 
 sys.path.insert(0, os.path.abspath("."))
 
@@ -30,6 +31,9 @@ class DummyCoordinator:
     async def async_request_refresh(self):
         return None
 
+    def async_set_updated_data(self, data):
+        self.data = data
+
 
 def test_text_entity_clamps_value():
     entity = PawControlTextEntity(
@@ -54,6 +58,13 @@ def test_number_entity_clamps_value():
     assert entity.native_value == 0
 
 
+def test_setters_write_the_value_back_to_the_coordinator():
+    coordinator = DummyCoordinator({"Other": 1})
+    entity = PawControlNumberEntity(coordinator, "Level", min_value=0, max_value=10)
+    asyncio.run(entity.async_set_native_value(15))
+    assert coordinator.data == {"Other": 1, "Level": 10}
+
+
 def test_select_entity_validates_option():
     entity = PawControlSelectEntity(
         DummyCoordinator(),
@@ -81,6 +92,19 @@ def test_datetime_entity_converts_value():
     assert value.minute == 0
 
 
+def test_datetime_entity_reuses_parsed_value_until_state_changes():
+    coordinator = DummyCoordinator({"Time": "2023-10-10T10:00:00Z"})
+    entity = PawControlDateTimeEntity(coordinator, "Time")
+    entity._update_state()
+    value = entity.native_value
+    assert value.utcoffset().total_seconds() == 0
+    assert entity.native_value is value
+
+    coordinator.data["Time"] = "2023-10-11T10:00:00+00:00"
+    entity._update_state()
+    assert entity.native_value.day == 11
+
+
 def test_binary_sensor_inherits_attributes_and_converts():
     coordinator = DummyCoordinator({"Door": "on"})
     entity = PawControlBinarySensorEntity(
@@ -102,6 +126,17 @@ def test_binary_sensor_inherits_attributes_and_converts():
     assert entity.is_on is False
 
 
+def test_attributes_use_coordinator_update_time():
+    updated = datetime(2023, 10, 10, 10, 0, tzinfo=UTC)
+    coordinator = DummyCoordinator({ATTR_LAST_UPDATED: updated, "Temp": 25})
+    entity = PawControlSensorEntity(
+        coordinator, "Temp", dog_name="Bello", unique_suffix="temp"
+    )
+    attrs = entity.extra_state_attributes
+    assert attrs[ATTR_LAST_UPDATED] == updated.isoformat()
+    assert entity.extra_state_attributes == attrs
+
+
 def test_sensor_entity_inherits_state_and_device_info():
     coordinator = DummyCoordinator({"Temp": 25})
     entity = PawControlSensorEntity(
@@ -116,6 +151,28 @@ def test_sensor_entity_inherits_state_and_device_info():
     assert ATTR_LAST_UPDATED in attrs
 
 
+def test_entity_identifiers_are_interned():
+    entity = PawControlSensorEntity(DummyCoordinator(), dog_name="Bello", key="weight")
+    assert entity._attr_name is sys.intern(entity._attr_name)
+    assert entity._attr_unique_id is sys.intern(f"{DOMAIN}_bello_weight")
+
+
+def test_update_state_skips_unchanged_data_version():
+    coordinator = DummyCoordinator({"Temp": 25})
+    coordinator.data_version = 1
+    entity = PawControlSensorEntity(coordinator, "Temp")
+    entity._update_state()
+    assert entity.state == 25
+
+    coordinator.data["Temp"] = 30
+    entity._update_state()
+    assert entity.state == 25
+
+    coordinator.data_version = 2
+    entity._update_state()
+    assert entity.state == 30
+
+
 def test_switch_entity_inherits_attributes_and_converts():
     coordinator = DummyCoordinator({"Light": "true"})
     entity = PawControlSwitchEntity(
@@ -140,3 +197,64 @@ def test_button_entity_has_device_info_and_attributes():
     attrs = entity.extra_state_attributes
     assert attrs[ATTR_DOG_NAME] == "Bello"
     assert ATTR_LAST_UPDATED in attrs
+
+
+class DebouncingCoordinator(DummyCoordinator):
+    """Coordinator whose refresh requests only arm a timer, like HA's Debouncer."""
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.data_version = 0
+        self.refreshes = 0
+        self.pending = {}
+
+    async def async_request_refresh(self):
+        return None
+
+    async def async_refresh(self):
+        self.refreshes += 1
+        await asyncio.sleep(0.01)
+        self.data = {**self.data, **self.pending}
+        self.data_version += 1
+
+
+def make_updating_entities(coordinator, count):
+    entities = [PawControlSensorEntity(coordinator, f"Pos {i}") for i in range(count)]
+    for entity in entities:
+        entity.hass = SimpleNamespace(async_create_task=asyncio.ensure_future)
+    return entities
+
+
+def test_concurrent_updates_share_one_refresh():
+    coordinator = DebouncingCoordinator({"Pos 0": 1, "Pos 1": 1, "Pos 2": 1})
+    entities = make_updating_entities(coordinator, 3)
+    coordinator.pending = {"Pos 0": 2, "Pos 1": 2, "Pos 2": 2}
+
+    async def run():
+        await asyncio.gather(*(entity.async_update() for entity in entities))
+
+    asyncio.run(run())
+    assert coordinator.refreshes == 1
+    assert [entity.state for entity in entities] == [2, 2, 2]
+
+    coordinator.pending = {"Pos 0": 3}
+    asyncio.run(run())
+    assert coordinator.refreshes == 2
+    assert entities[0].state == 3
+
+
+def test_cancelled_update_does_not_cancel_the_shared_refresh():
+    coordinator = DebouncingCoordinator({"Pos 1": 1})
+    entities = make_updating_entities(coordinator, 2)
+    coordinator.pending = {"Pos 1": 2}
+
+    async def run():
+        first = asyncio.ensure_future(entities[0].async_update())
+        second = asyncio.ensure_future(entities[1].async_update())
+        await asyncio.sleep(0)
+        first.cancel()
+        await second
+        assert first.cancelled()
+
+    asyncio.run(run())
+    assert entities[1].state == 2
@@ -2,6 +2,8 @@ from custom_components.pawcontrol.helpers.entity import (
     as_bool,
     clamp_value,
     ensure_option,
+    format_name,
+    parse_datetime,
 )
 
 
@@ -23,3 +25,18 @@ def test_as_bool():
     assert as_bool("on") is True
     assert as_bool("off") is False
     assert as_bool(0) is False
+
+
+def test_parse_datetime():
+    assert parse_datetime("2023-10-10T10:00:00Z").hour == 10
+    assert parse_datetime("2023-10-10 10:00").minute == 0
+    assert parse_datetime("unknown") is None
+    assert parse_datetime("gestern") is None
+    assert parse_datetime("2023-13-45T10:00") is None
+    assert parse_datetime(None) is None
+
+
+def test_format_name():
+    assert format_name("bello", "last_vet_visit") == "Bello Last Vet Visit"
+    assert format_name("rex", "last_vet_visit") == "Rex Last Vet Visit"
+    assert format_name("rex", "last_vet_visit") is format_name("rex", "last_vet_visit")
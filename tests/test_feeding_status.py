@@ -1,4 +1,6 @@
 import asyncio
+import logging
+import sys
 
 from custom_components.pawcontrol.coordinator import PawControlCoordinator
 
@@ -30,15 +32,176 @@ def make_coordinator(morning="off", evening="off"):
         }
     )
     coordinator.dog_name = "Bello"
+    coordinator.data = None
+    coordinator._dirty = True
+    coordinator._num_cache = {}
+    coordinator._summary_cache = None
+    coordinator._err_counts = {}
+    coordinator.data_version = 0
     return coordinator
 
 
+def feeding_status(morning, evening):
+    coordinator = make_coordinator(morning, evening)
+    return coordinator._get_feeding_status(coordinator._snapshot_states())
+
+
 def test_needs_feeding_logic():
-    status = asyncio.run(make_coordinator("on", "off")._get_feeding_status())
+    status = feeding_status("on", "off")
     assert status["needs_feeding"]
 
-    status = asyncio.run(make_coordinator("on", "on")._get_feeding_status())
+    status = feeding_status("on", "on")
     assert not status["needs_feeding"]
 
-    status = asyncio.run(make_coordinator("off", "off")._get_feeding_status())
+    status = feeding_status("off", "off")
     assert status["needs_feeding"]
+
+
+def test_snapshot_reads_each_tracked_entity_once():
+    coordinator = make_coordinator("on", "on")
+    states = coordinator._snapshot_states()
+    assert states["feeding_morning"].state == "on"
+    assert states["walk_count"] is None
+
+
+def test_entity_ids_are_built_once():
+    coordinator = make_coordinator()
+    entity_ids = coordinator._entity_ids
+    assert entity_ids["feeding_morning"] == "input_boolean.Bello_feeding_morning"
+    assert coordinator._entity_ids is entity_ids
+
+
+def test_status_summary_covers_every_combination():
+    coordinator = make_coordinator()
+
+    def set_status(evening_fed, walked_today, was_outside):
+        coordinator.data = {
+            "feeding_status": {"morning_fed": True, "evening_fed": evening_fed},
+            "activity_status": {
+                "walked_today": walked_today,
+                "was_outside": was_outside,
+            },
+        }
+
+    set_status(evening_fed=True, walked_today=True, was_outside=False)
+    assert coordinator.get_status_summary() == "📝 Teilweise erledigt"
+
+    set_status(evening_fed=True, walked_today=True, was_outside=True)
+    assert coordinator.get_status_summary() == "✅ Alles erledigt"
+
+    set_status(evening_fed=True, walked_today=False, was_outside=False)
+    assert coordinator.get_status_summary() == "🚶 Spaziergang ausstehend"
+
+    set_status(evening_fed=False, walked_today=False, was_outside=False)
+    assert coordinator.get_status_summary() == "⏰ Fütterung & Spaziergang ausstehend"
+
+
+def test_update_reuses_data_until_a_tracked_state_changes():
+    coordinator = make_coordinator("on", "on")
+    coordinator.data = asyncio.run(coordinator._async_update_data())
+    assert coordinator.data["feeding_status"]["morning_fed"]
+    assert coordinator.data_version == 1
+
+    coordinator.hass.states._states["input_boolean.Bello_feeding_morning"] = DummyState(
+        "off"
+    )
+    assert asyncio.run(coordinator._async_update_data()) is coordinator.data
+    assert coordinator.data_version == 1
+
+    coordinator._dirty = True
+    data = asyncio.run(coordinator._async_update_data())
+    assert not data["feeding_status"]["morning_fed"]
+    assert coordinator.data_version == 2
+
+
+def test_rebuild_keeps_values_pushed_by_entities():
+    coordinator = make_coordinator("on", "on")
+    coordinator.data = asyncio.run(coordinator._async_update_data())
+    coordinator.data = {**coordinator.data, "Bello Gewicht": 12.5}
+
+    coordinator._dirty = True
+    data = asyncio.run(coordinator._async_update_data())
+    assert data["Bello Gewicht"] == 12.5
+    assert data["feeding_status"]["morning_fed"]
+
+
+def test_numeric_states_are_parsed_once_per_value():
+    coordinator = make_coordinator()
+    state = DummyState("12.5")
+    state.entity_id = "input_number.Bello_weight"
+    assert coordinator._parse_number(state, float, None) == 12.5
+    assert coordinator._num_cache[state.entity_id] == ("12.5", 12.5)
+
+    coordinator._num_cache[state.entity_id] = ("12.5", 99.0)
+    assert coordinator._parse_number(state, float, None) == 99.0
+
+    state.state = "13"
+    assert coordinator._parse_number(state, float, None) == 13.0
+
+
+def test_invalid_numeric_states_fall_back_to_the_default():
+    coordinator = make_coordinator()
+    state = DummyState("unknown")
+    state.entity_id = "counter.Bello_walk_count"
+    states = coordinator._snapshot_states()
+    states["walk_count"] = state
+    activity = coordinator._get_activity_status(states)
+    assert activity["walk_count"] == 0
+    assert activity["walked_today"] is False
+    assert coordinator._get_health_status(states)["weight"] is None
+
+
+def test_missing_helpers_keep_the_previous_values():
+    coordinator = make_coordinator()
+    coordinator.data = {
+        "activity_status": {"walked_today": True, "walk_count": 3},
+        "health_status": {"weight": 21.5},
+    }
+    states = coordinator._snapshot_states()
+    activity = coordinator._get_activity_status(states)
+    assert activity["walked_today"] is True
+    assert activity["walk_count"] == 3
+    assert not activity["needs_walk"]
+    assert coordinator._get_health_status(states)["weight"] == 21.5
+    assert coordinator._get_feeding_status(states)["morning_fed"] is False
+
+
+def test_per_dog_state_is_slotted():
+    coordinator = make_coordinator()
+    assert coordinator.dog_name == "Bello"
+    assert "dog_name" not in vars(coordinator)
+    assert "_dirty" not in vars(coordinator)
+
+
+def test_status_summary_strings_are_interned():
+    coordinator = make_coordinator()
+    coordinator.data = {"feeding_status": {}, "activity_status": {}}
+    summary = coordinator.get_status_summary()
+    assert summary is sys.intern("⏰ Fütterung & Spaziergang ausstehend")
+
+
+def test_status_summary_is_cached_until_the_next_rebuild():
+    coordinator = make_coordinator("on", "on")
+    coordinator.data = asyncio.run(coordinator._async_update_data())
+    summary = coordinator.get_status_summary()
+    assert summary == "🚶 Spaziergang ausstehend"
+
+    coordinator.hass.states._states["input_boolean.Bello_walked_today"] = DummyState(
+        "on"
+    )
+    assert coordinator.get_status_summary() is summary
+
+    coordinator._dirty = True
+    coordinator.data = asyncio.run(coordinator._async_update_data())
+    assert coordinator.get_status_summary() == "📝 Teilweise erledigt"
+
+
+def test_repeated_update_errors_log_a_traceback_only_periodically(caplog):
+    coordinator = make_coordinator()
+    coordinator.hass.states = None
+    with caplog.at_level(logging.DEBUG):
+        for _ in range(100):
+            assert asyncio.run(coordinator._async_update_data()) == {}
+    tracebacks = [record for record in caplog.records if record.exc_info]
+    assert len(tracebacks) == 2
+    assert coordinator._err_counts["update"] == 100
@@ -1,6 +1,6 @@
 import asyncio
 import sys
-from datetime import UTC, datetime, timedelta, timezone
+from datetime import UTC, datetime, time, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -12,15 +12,27 @@ sys.path.insert(0, str(Path().resolve()))
 
 from custom_components.pawcontrol.exceptions import InvalidCoordinates
 from custom_components.pawcontrol.utils import (
+    calculate_distance,
     calculate_dog_calories_per_day,
     calculate_speed_kmh,
     call_service,
+    distance_from_center,
     format_distance,
     format_duration,
     format_weight,
+    get_gps_accuracy_level,
+    get_gps_accuracy_levels,
+    get_meal_icon,
+    get_meal_label,
+    is_emergency_situation,
+    is_within_radius,
     merge_entry_options,
     parse_coordinates_string,
+    parse_time_of_day,
+    safe_batch_service_call,
+    safe_int_convert,
     time_since_last_activity,
+    validate_data_against_rules,
     validate_dog_name,
     validate_weight,
 )
@@ -43,6 +55,14 @@ def test_merge_entry_options_overrides_data():
     assert merge_entry_options(entry) == {"a": 1, "b": 2, "c": 4}
 
 
+def test_meal_lookups_fall_back_for_unknown_meals():
+    """Known meals resolve to labels/icons, unknown ones fall back."""
+    assert get_meal_label("morning") == "Frühstück"
+    assert get_meal_label("brunch") == "brunch"
+    assert get_meal_icon("evening") == "mdi:weather-night"
+    assert get_meal_icon("brunch") == "mdi:food"
+
+
 def test_call_service_wrapper():
     """call_service should proxy to hass.services.async_call."""
 
@@ -188,3 +208,151 @@ def test_parse_coordinates_string_invalid_inputs():
         parse_coordinates_string("10")  # missing lon
     with pytest.raises(InvalidCoordinates):
         parse_coordinates_string(None)
+
+
+def test_validate_data_against_rules_reports_range_errors():
+    """Values outside the validation ranges produce readable errors."""
+    assert validate_data_against_rules({"weight": 10, "other": "x"}) == []
+    assert validate_data_against_rules({"weight": 0.1}) == [
+        "weight must be at least 0.5 kg"
+    ]
+    assert validate_data_against_rules({"age": 30}) == ["age must be at most 25 years"]
+    assert validate_data_against_rules({"age": "old"}) == ["age must be a valid number"]
+
+
+def test_calculate_distance_haversine():
+    """One degree of longitude at the equator is roughly 111.2 km."""
+    assert calculate_distance((0.0, 0.0), (0.0, 0.0)) == 0.0
+    assert calculate_distance((0.0, 0.0), (0.0, 1.0)) == pytest.approx(111195, rel=1e-4)
+    with pytest.raises(InvalidCoordinates):
+        calculate_distance((91.0, 0.0), (0.0, 0.0))
+
+
+@pytest.mark.parametrize(
+    ("accuracy", "expected"),
+    [
+        (0, "Ausgezeichnet"),
+        (5, "Ausgezeichnet"),
+        (5.1, "Gut"),
+        (15, "Gut"),
+        (50, "Akzeptabel"),
+        (50.5, "Schlecht"),
+    ],
+)
+def test_get_gps_accuracy_level_boundaries(accuracy, expected):
+    """Thresholds are inclusive upper bounds."""
+    assert get_gps_accuracy_level(accuracy) == expected
+
+
+def test_get_gps_accuracy_level_nan_is_poor():
+    """A NaN reading is not treated as a precise fix."""
+    assert get_gps_accuracy_level(float("nan")) == "Schlecht"
+
+
+def test_get_gps_accuracy_levels_matches_scalar_lookup():
+    """The batch classifier agrees with the per-reading lookup."""
+    accuracies = [0, 5, 5.1, 15, 50, 50.5, 120, float("nan")]
+    assert get_gps_accuracy_levels(accuracies) == [
+        get_gps_accuracy_level(accuracy) for accuracy in accuracies
+    ]
+    assert get_gps_accuracy_levels([float("nan")]) == ["Schlecht"]
+    assert get_gps_accuracy_levels(()) == []
+
+
+@pytest.mark.parametrize(
+    ("health_data", "expected"),
+    [
+        ({"temperature": 38.5, "heart_rate": 90}, False),
+        ({"temperature": 41.5, "heart_rate": 90}, True),
+        ({"temperature": 36.5, "heart_rate": 90}, True),
+        ({"temperature": 38.5, "heart_rate": 200}, True),
+        ({"temperature": 38.5, "heart_rate": 40}, True),
+        ({"temperature": 38.5, "heart_rate": 90, "health_status": "Notfall"}, True),
+        ({"temperature": 38.5, "heart_rate": 90, "emergency_mode": "emergency"}, True),
+    ],
+)
+def test_is_emergency_situation(health_data, expected):
+    """Vital signs are checked against the shared VITAL_SIGN_RANGES."""
+    assert is_emergency_situation(health_data) is expected
+
+
+def test_distance_from_center_matches_haversine():
+    """The cached-center variant agrees with ``calculate_distance``."""
+    center = (52.2333, 8.9667)
+    point = (52.2400, 8.9800)
+    assert distance_from_center(center, point) == pytest.approx(
+        calculate_distance(center, point)
+    )
+    with pytest.raises(InvalidCoordinates):
+        distance_from_center(center, (95.0, 0.0))
+
+
+def test_is_within_radius_uses_exact_distance_near_boundary():
+    """Points are classified by distance, the latitude band only rejects early."""
+    center = (0.0, 0.0)
+    assert is_within_radius(center, (0.0, 0.0009), 101)
+    assert not is_within_radius(center, (0.0, 0.0009), 99)
+    assert not is_within_radius(center, (1.0, 0.0), 1000)
+
+
+def test_parse_time_of_day_caches_parsed_states():
+    """Schedule states parse to ``time`` objects and are reused."""
+    assert parse_time_of_day("07:30:00") == time(7, 30)
+    assert parse_time_of_day("07:30:00") is parse_time_of_day("07:30:00")
+    with pytest.raises(ValueError, match="Invalid isoformat"):
+        parse_time_of_day("unknown")
+
+
+def test_safe_batch_service_call_targets_existing_entities_once():
+    """Existing entities are handled by a single service call."""
+
+    async def run_test():
+        mock_call = AsyncMock()
+        hass = SimpleNamespace(
+            services=SimpleNamespace(
+                async_call=mock_call, has_service=lambda _domain, _service: True
+            ),
+            states=SimpleNamespace(get=lambda entity_id: entity_id != "counter.b"),
+        )
+        assert await safe_batch_service_call(
+            hass, "counter", "reset", ["counter.a", "counter.b", "counter.c"]
+        )
+        mock_call.assert_called_once_with(
+            "counter", "reset", {"entity_id": ["counter.a", "counter.c"]}, blocking=True
+        )
+        assert not await safe_batch_service_call(hass, "counter", "reset", [])
+
+    asyncio.run(run_test())
+
+
+def test_safe_batch_service_call_retries_entities_after_a_failed_batch():
+    """A failing batch falls back to one call per entity."""
+
+    async def async_call(_domain, _service, data, **_kwargs):
+        if "counter.bad" in data["entity_id"]:
+            raise ValueError
+
+    async def run_test():
+        mock_call = AsyncMock(side_effect=async_call)
+        hass = SimpleNamespace(
+            services=SimpleNamespace(
+                async_call=mock_call, has_service=lambda _domain, _service: True
+            ),
+            states=SimpleNamespace(get=lambda _entity_id: True),
+        )
+        assert not await safe_batch_service_call(
+            hass, "counter", "reset", ["counter.a", "counter.bad", "counter.c"]
+        )
+        called = [call.args[2]["entity_id"] for call in mock_call.call_args_list]
+        assert called[1:] == ["counter.a", "counter.bad", "counter.c"]
+
+    asyncio.run(run_test())
+
+
+def test_safe_int_convert_handles_digits_floats_and_garbage():
+    """Plain digit strings, float strings and invalid values all convert."""
+    assert safe_int_convert("87") == 87
+    assert safe_int_convert("87.9") == 87
+    assert safe_int_convert(" 5 ") == 5
+    assert safe_int_convert("unknown", default=-1) == -1
+    assert safe_int_convert(None) == 0